@@ -4,104 +4,1533 @@
 # ============================================================================
 
 # --- 1. Install Required Packages ---
-# pip install requests beautifulsoup4 selenium pandas spacy python-docx transformers
+# pip install requests httpx[http2] lxml beautifulsoup4 selenium pandas spacy python-docx transformers pypdf
 
 import os
+import re
 import csv
 import time
 import queue
+import math
+import heapq
+import json
+import sqlite3
+import zlib
+import asyncio
+import hashlib
 import logging
-from urllib.parse import urljoin, urlparse
+import importlib.metadata
+import argparse
+import itertools
+import urllib.robotparser
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from html import unescape
+from pathlib import Path
+from collections import deque, namedtuple
+from contextlib import contextmanager, asynccontextmanager
+from concurrent.futures import ProcessPoolExecutor
+from urllib.parse import urljoin, urlparse, urlsplit, urlunsplit, quote_plus, unquote_plus
 
-import requests
-from bs4 import BeautifulSoup
+import httpx
+import lxml.html
+from lxml import etree
 
-import spacy
-from transformers import pipeline
-from docx import Document
+# spaCy, transformers, python-docx, pypdf and Selenium are imported where they are
+# first needed: importing them alone takes seconds, and a crawl-only run
+# never touches the NLP models.
 
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
+try:
+    import h2  # noqa: F401  (lets httpx negotiate HTTP/2)
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
 
 # --- Setup Logging and Output Directory ---
 logging.basicConfig(level=logging.INFO)
-output_dir = "C:/data/AutismEmployment"
-txt_dir = os.path.join(output_dir, "pages")
-os.makedirs(txt_dir, exist_ok=True)
-csv_path = os.path.join(output_dir, "index.csv")
-report_path = os.path.join(output_dir, "AutismEmploymentReport.docx")
+logging.getLogger("httpx").setLevel(logging.WARNING)
+logging.getLogger("pypdf").setLevel(logging.ERROR)  # font/encoding warnings on most papers
 
-# --- Load NLP Models ---
-nlp = spacy.load("en_core_web_sm")
-summarizer = pipeline("summarization")
-sentiment_analyzer = pipeline("sentiment-analysis")
+def set_output_dir(path):
+    global output_dir, txt_dir, csv_path, documents_path, docs_dir, report_path, frontier_path
+    global page_cache_path, nlp_cache_path, doc_cache_path
+    output_dir = path
+    txt_dir = os.path.join(output_dir, "pages")
+    csv_path = os.path.join(output_dir, "index.csv")
+    documents_path = os.path.join(output_dir, "documents.csv")
+    docs_dir = os.path.join(output_dir, "documents")
+    report_path = os.path.join(output_dir, "AutismEmploymentReport.docx")
+    frontier_path = os.path.join(output_dir, "frontier.sqlite")
+    page_cache_path = os.path.join(output_dir, "page_cache.sqlite")
+    nlp_cache_path = os.path.join(output_dir, "nlp_cache.sqlite")
+    doc_cache_path = os.path.join(output_dir, "doc_cache.sqlite")
+
+set_output_dir("C:/data/AutismEmployment")
+
+# --- Crawl Settings ---
+CONCURRENCY = 20  # max requests in flight across all hosts
+PER_HOST_RATE = 1.0  # max requests per second to any single host
+MAX_FRONTIER = 100_000  # queued URLs kept at once; 0 means unbounded
+FRONTIER_OVERFLOW = "drop-lowest"  # or "drop-new", when the frontier is full
+VISITED_BACKEND = "memory"  # "memory" (exact set), "bloom" (approximate) or "disk" (exact, SQLite)
+BLOOM_ERROR_RATE = 0.001  # overall false-positive rate of the "bloom" backend
+BLOOM_INITIAL_CAPACITY = 100_000  # keys in the first Bloom filter before it scales up
+RESPECT_ROBOTS = True  # filter URLs by robots.txt and honour its Crawl-delay
+ROBOTS_TTL = 24 * 3600  # seconds a fetched robots.txt is trusted
+ROBOTS_ERROR_TTL = 600  # seconds an unreachable robots.txt blocks its host before a retry
+ROBOTS_MAX_BYTES = 500 * 1024  # robots.txt content beyond this is ignored (RFC 9309)
+ROBOTS_MAX_CRAWL_DELAY = 30  # seconds; longer Crawl-delay values are capped
+USE_SITEMAPS = True  # seed the frontier from the seed sites' sitemaps
+SITEMAP_MAX_FILES = 50  # sitemap files (index + children) read per site
+SITEMAP_MAX_URLS = 5000  # relevant sitemap entries queued per site
+SITEMAP_MAX_AGE_DAYS = 5 * 365  # skip entries whose lastmod is older; 0 keeps all
+SITEMAP_MAX_BYTES = 100 * 2**20  # decompressed size at which a sitemap is abandoned
+PARSE_WORKERS = os.cpu_count() or 1  # parser processes; 0 parses on the event loop
+SELENIUM_POOL_SIZE = 2  # headless Chrome instances kept alive for JS pages
+SELENIUM_MAX_USES = 50  # recycle a driver after this many pages
+MIN_STATIC_TEXT = 200  # visible characters below which static HTML is treated as a JS shell
+RENDERED_DOMAIN_MIN_PAGES = 2  # pages Selenium must clearly improve before a domain always renders
+MIN_MAIN_TEXT = 250  # characters a main-content candidate needs before it replaces the whole page
+ANCHOR_WEIGHT = 3.0  # link score per keyword hit in the anchor text
+URL_WEIGHT = 2.0  # link score per keyword hit in the URL path/query
+PARENT_WEIGHT = 1.0  # link score per keyword hit per 100 words of the linking page
+SEED_SCORE = math.inf  # seeds are always fetched before discovered links
+# Query parameters dropped from every URL (regexes, matched against the name)
+STRIP_QUERY_PARAMS = [r"^utm_", r"^(fbclid|gclid|dclid|msclkid|yclid)$", r"^(mc_cid|mc_eid|_ga|_gl|_hsenc|_hsmi)$",
+                      r"^(sessionid|jsessionid|phpsessid|sid)$", r"^(ref|referrer|share)$"]
+# Extra per-domain rules, keyed like get_domain() (a rule for "ca.gov" also
+# applies to its subdomains), e.g. {"example.gov": [r"^sort$", r"^page_view$"]}
+STRIP_QUERY_PARAMS_BY_DOMAIN = {}
+# Relevance keywords, from both crawlers. Matched on word boundaries; a
+# trailing * also accepts longer words ("program*" matches "programs").
+KEYWORDS = ["autism*", "employment*", "program*", "effectiveness", "outcome*", "evaluation*",
+            "vocational rehab*", "transition to work", "supported employment", "neurodiverse",
+            "job coach*"]
+
+# --- HTTP Session Settings ---
+HTTP_TIMEOUT = 10  # seconds per request
+HTTP_MAX_CONNECTIONS = 100  # open sockets across all hosts
+HTTP_KEEPALIVE_CONNECTIONS = 50  # idle sockets kept for reuse
+HTTP_KEEPALIVE_EXPIRY = 30  # seconds an idle socket is kept open
+HTTP_RETRIES = 3  # extra attempts on connection errors, 429 and 5xx
+HTTP_BACKOFF = 0.5  # first retry delay in seconds, doubled on each attempt
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+MAX_PAGE_BYTES = 5 * 2**20  # HTML bodies larger than this are abandoned mid-download
+HTML_TYPES = {"text/html", "application/xhtml+xml"}
+DOCUMENT_TYPES = {"application/pdf"}  # handed to the document pipeline instead of parsed
+# Links to files we never process are dropped before they are queued
+SKIP_LINK_EXT_RE = re.compile(
+    r'\.(jpe?g|png|gif|svg|webp|bmp|ico|tiff?|mp3|mp4|m4a|wav|avi|mov|wmv|mkv|webm|flv|'
+    r'zip|gz|tgz|rar|7z|exe|dmg|msi|iso|css|js|woff2?|ttf|eot|docx?|xlsx?|pptx?|csv)$', re.I)
+DOCUMENT_EXT_RE = re.compile(r'\.pdf$', re.I)
+USER_AGENT = "AutismEmploymentCrawler/1.0 (research)"
+
+# --- Document Settings ---
+LOCAL_PDF_DIR = os.path.dirname(os.path.abspath(__file__))  # research PDFs kept next to this script
+LOCAL_DOCUMENT_ORG = "Local research PDFs"  # Organization column for local PDFs
+PDF_WORKERS = os.cpu_count() or 1  # text extraction processes; 0 extracts inline
+PDF_PAGES_PER_TASK = 16  # pages per extraction task, so long PDFs spread over processes
+MAX_DOCUMENT_BYTES = 100 * 2**20  # crawled PDFs larger than this are not downloaded
+
+# --- NLP Settings ---
+# Models are pinned so cached results can be keyed on exactly what made them
+SPACY_MODEL = "en_core_web_sm"
+SUMMARY_MODEL, SUMMARY_REVISION = "sshleifer/distilbart-cnn-12-6", "a4f8f3e"
+SENTIMENT_MODEL, SENTIMENT_REVISION = "distilbert/distilbert-base-uncased-finetuned-sst-2-english", "714eb0f"
+SUMMARY_MODE = "chunked"  # "chunked" map-reduces the whole page, "truncate" uses text[:N] only
+SUMMARY_INPUT_CHARS = 1000  # text[:N] fed to the summarizer in "truncate" mode
+SUMMARY_CHUNK_TOKENS = 900  # token budget per chunk, under the model's 1024 limit
+SUMMARY_MAX_CHUNKS = 8  # chunks summarized per page; caps compute on very long pages
+SENTIMENT_INPUT_CHARS = 512  # text[:N] fed to the sentiment model
+SUMMARY_ARGS = {"max_length": 130, "min_length": 30, "do_sample": False}
+# Per-chunk summaries are kept short so all of a page's chunk summaries fit
+# into a single reduce pass (8 x 80 tokens < 1024)
+SUMMARY_CHUNK_ARGS = {"max_length": 80, "min_length": 20, "do_sample": False}
+NLP_CACHE_MAX_MB = 500  # least recently used results are evicted beyond this
+NLP_CHUNK_PAGES = 64  # pages read from disk and analyzed together
+SUMMARY_BATCH_SIZE = 8  # inputs per summarizer forward pass
+SENTIMENT_BATCH_SIZE = 32  # inputs per sentiment forward pass
+SPACY_BATCH_SIZE = 32  # texts per nlp.pipe batch
+SPACY_PROCESSES = 2  # nlp.pipe worker processes for entity extraction
+# Characters of each page sent to NER. Must stay under spaCy's nlp.max_length
+# (1,000,000): one longer text (a long PDF) raises E088 and ends the whole
+# pipe. Covers full research papers; long reports are cut.
+SPACY_INPUT_CHARS = 100_000
+# Only NER is used; in en_core_web_sm it has its own embedding layer, so the
+# shared tok2vec can go along with everything else
+SPACY_EXCLUDE = ["tok2vec", "tagger", "parser", "attribute_ruler", "lemmatizer", "senter"]
+
+# --- Selenium Driver Pool ---
+def new_driver():
+    from selenium import webdriver
+    from selenium.webdriver.chrome.options import Options
+
+    options = Options()
+    options.add_argument('--headless')
+    driver = webdriver.Chrome(options=options)
+    driver.set_page_load_timeout(15)
+    return driver
+
+def quit_driver(driver):
+    try:
+        driver.quit()
+    except Exception as e:
+        logging.warning(f"Failed to quit Chrome driver: {e}")
+
+# Bounded pool of long-lived headless drivers. Each slot holds (driver, uses);
+# drivers are started lazily, and are replaced after `max_uses` pages or as
+# soon as a page load raises, since a crashed Chrome is rarely reusable.
+# If Chrome can't be started at all (no binary, no driver) the pool is
+# marked unavailable so the crawl stops trying to render for the rest of
+# the run.
+class DriverPool:
+    def __init__(self, size=SELENIUM_POOL_SIZE, max_uses=SELENIUM_MAX_USES):
+        self.size = size
+        self.max_uses = max_uses
+        self.unavailable = False
+        self._slots = queue.Queue()
+        for _ in range(size):
+            self._slots.put((None, 0))
+
+    @contextmanager
+    def driver(self):
+        driver, uses = self._slots.get()
+        try:
+            if driver is None:
+                driver, uses = self._start(), 0
+            yield driver
+            uses += 1
+        except Exception:
+            if driver is not None:
+                quit_driver(driver)
+                driver = None
+            raise
+        finally:
+            if driver is not None and uses >= self.max_uses:
+                quit_driver(driver)
+                driver = None
+            self._slots.put((driver, uses) if driver is not None else (None, 0))
+
+    def _start(self):
+        try:
+            return new_driver()
+        except Exception as e:
+            if not self.unavailable:
+                self.unavailable = True
+                logging.error(f"Could not start Chrome, Selenium rendering is off for this run: {e}")
+            raise
+
+    def close(self):
+        # Call once no fetches are running; every slot is idle then
+        for _ in range(self.size):
+            driver, _ = self._slots.get()
+            if driver is not None:
+                quit_driver(driver)
+            self._slots.put((None, 0))
+
+driver_pool = DriverPool()
+
+# --- Rendering Heuristics ---
+def get_domain(url):
+    return urlparse(url).netloc.replace("www.", "")
+
+SCRIPT_STYLE_RE = re.compile(r'<(script|style|template)\b.*?</\1\s*>', re.I | re.S)
+TAG_RE = re.compile(r'<[^>]+>')
+SPA_MARKER_RE = re.compile(
+    r'<div[^>]+id=["\'](?:root|app|__next|__nuxt)["\'][^>]*>\s*</div>'
+    r'|<app-root|\bng-app\b|data-reactroot|data-server-rendered', re.I)
+NOSCRIPT_WARNING_RE = re.compile(
+    r'<noscript[^>]*>(?:(?!</noscript>).)*?(?:enable|requires?|turn on)\s+javascript', re.I | re.S)
+
+# Cheap regex checks so deciding doesn't cost a full parse of the page
+def visible_text_len(html):
+    visible = TAG_RE.sub(' ', SCRIPT_STYLE_RE.sub(' ', html))
+    return len(''.join(visible.split()))
+
+def needs_rendering(html):
+    text_len = visible_text_len(html)
+    if text_len < MIN_STATIC_TEXT:
+        return True
+    marked = SPA_MARKER_RE.search(html) or NOSCRIPT_WARNING_RE.search(html)
+    return bool(marked) and text_len < 5 * MIN_STATIC_TEXT
+
+# Rendering only counts as having helped when the rendered page stops looking
+# like a JS shell or has clearly more text; a page that is just thin either
+# way (a short landing page, an empty listing) doesn't count
+def rendering_helped(static_html, rendered_html):
+    if not needs_rendering(rendered_html):
+        return True
+    static_len, rendered_len = visible_text_len(static_html), visible_text_len(rendered_html)
+    return rendered_len >= max(2 * static_len, static_len + MIN_STATIC_TEXT)
+
+# Domains where Selenium helped on RENDERED_DOMAIN_MIN_PAGES pages; later
+# pages skip the static fetch
+rendered_domains = set()
+render_wins = {}
 
 # --- Fetch Page Content ---
-def get_page_content(url, use_selenium=False):
+def render_with_selenium(url):
+    with driver_pool.driver() as driver:
+        driver.get(url)
+        return driver.page_source
+
+# Media type from Content-Type, or sniffed from the first bytes when the
+# server sends none (or a generic binary type)
+def media_type(resp, first_chunk=b''):
+    declared = resp.headers.get('Content-Type', '').split(';')[0].strip().lower()
+    if declared and declared != 'application/octet-stream':
+        return declared
+    head = first_chunk[:512].lstrip(b'\xef\xbb\xbf \t\r\n').lower()
+    if head.startswith(b'%pdf-'):
+        return 'application/pdf'
+    if head.startswith((b'<!doctype html', b'<html', b'<head', b'<body', b'<!--')):
+        return 'text/html'
+    return declared or 'application/octet-stream'
+
+# Reads the body chunk by chunk; returns (body, media type), with body None
+# as soon as the response turns out not to be in `accept` or to be larger
+# than max_bytes, so the rest is never downloaded or decoded
+async def read_body(resp, accept=None, max_bytes=None):
+    length = resp.headers.get('Content-Length', '')
+    media = media_type(resp)
+    if max_bytes and length.isdigit() and int(length) > max_bytes:
+        return None, media
+    if accept and media != 'application/octet-stream' and media not in accept:
+        return None, media
+    body = bytearray()
+    async for chunk in resp.aiter_bytes():
+        if not body:
+            media = media_type(resp, chunk)
+            if accept and media not in accept:
+                return None, media
+        body += chunk
+        if max_bytes and len(body) > max_bytes:
+            return None, media
+    return bytes(body), media
+
+def decode_body(resp, body):
     try:
-        if use_selenium:
-            options = Options()
-            options.add_argument('--headless')
-            driver = webdriver.Chrome(options=options)
-            driver.set_page_load_timeout(15)
-            driver.get(url)
-            html = driver.page_source
-            driver.quit()
-        else:
-            resp = requests.get(url, timeout=10)
-            resp.raise_for_status()
-            html = resp.text
-        return html
+        return body.decode(resp.charset_encoding or 'utf-8', errors='replace')
+    except LookupError:
+        return body.decode('utf-8', errors='replace')
+
+# A streamed GET, so the headers can be checked before the body is read.
+# Returns (response, body, media type). body is None for 304 Not Modified
+# (passed back, not raised) and for responses read_body() abandoned.
+async def fetch_static(client, url, headers=None, accept=None, max_bytes=None):
+    for attempt in range(HTTP_RETRIES + 1):
+        delay = HTTP_BACKOFF * 2 ** attempt
+        try:
+            async with client.stream("GET", url, headers=headers) as resp:
+                if resp.status_code == 304:
+                    return resp, None, None
+                if resp.status_code not in RETRY_STATUSES or attempt == HTTP_RETRIES:
+                    resp.raise_for_status()
+                    body, media = await read_body(resp, accept, max_bytes)
+                    return resp, body, media
+                retry_after = resp.headers.get("Retry-After", "")
+                if retry_after.isdigit():
+                    delay = max(delay, min(int(retry_after), 60))
+        except httpx.TransportError:
+            if attempt == HTTP_RETRIES:
+                raise
+        logging.warning(f"Retrying {url} in {delay:.1f}s (attempt {attempt + 1}/{HTTP_RETRIES})")
+        await asyncio.sleep(delay)
+
+async def fetch_rendered(url):
+    # Selenium is blocking, so keep it off the event loop
+    return await asyncio.to_thread(render_with_selenium, url)
+
+# `document` is the media type of a response routed to the document
+# pipeline (html is None then)
+Fetched = namedtuple('Fetched', 'html etag last_modified not_modified document', defaults=(None,))
+
+def conditional_headers(cached):
+    headers = {}
+    if cached and cached['etag']:
+        headers['If-None-Match'] = cached['etag']
+    if cached and cached['last_modified']:
+        headers['If-Modified-Since'] = cached['last_modified']
+    return headers
+
+# use_selenium=None (the default) tries the static fetch first and escalates
+# to Selenium only when the HTML looks like it needs JavaScript to render.
+# `cached` is the PageCache row from the previous crawl, if any; its
+# validators turn the static fetch into a conditional GET. Responses that
+# aren't HTML (or are over MAX_PAGE_BYTES) are dropped after their headers;
+# DOCUMENT_TYPES come back as Fetched(document=media type) instead.
+async def get_page_content(client, url, use_selenium=None, cached=None):
+    domain = get_domain(url)
+    try:
+        if not DOCUMENT_EXT_RE.search(urlsplit(url).path) and not driver_pool.unavailable and (
+                use_selenium or (use_selenium is None and domain in rendered_domains)):
+            return Fetched(await fetch_rendered(url), None, None, False)
+        resp, body, media = await fetch_static(client, url, conditional_headers(cached),
+                                               accept=HTML_TYPES, max_bytes=MAX_PAGE_BYTES)
     except Exception as e:
         logging.error(f"Failed to fetch {url}: {e}")
         return None
 
-# --- Extract Links ---
-def extract_links(html, base_url):
-    soup = BeautifulSoup(html, 'html.parser')
-    links = set()
-    for tag in soup.find_all('a', href=True):
-        href = tag.get('href')
-        abs_url = urljoin(base_url, href)
+    etag = resp.headers.get('ETag')
+    last_modified = resp.headers.get('Last-Modified')
+    if resp.status_code == 304:
+        return Fetched(None, etag or cached['etag'], last_modified or cached['last_modified'], True)
+    if media in DOCUMENT_TYPES:
+        return Fetched(None, etag, last_modified, False, media)
+    if body is None:
+        size = resp.headers.get('Content-Length', 'unknown')
+        logging.info(f"Skipped {url}: {media}, {size} bytes")
+        return None
+
+    html = decode_body(resp, body)
+    if use_selenium is None and not driver_pool.unavailable and needs_rendering(html):
+        logging.info(f"Rendering {url} with Selenium")
+        try:
+            rendered = await fetch_rendered(url)
+        except Exception as e:
+            logging.error(f"Failed to render {url}, keeping static HTML: {e}")
+        else:
+            if rendering_helped(html, rendered):
+                html = rendered
+                etag = last_modified = None
+                render_wins[domain] = render_wins.get(domain, 0) + 1
+                if render_wins[domain] >= RENDERED_DOMAIN_MIN_PAGES and domain not in rendered_domains:
+                    logging.info(f"Escalating {domain} to Selenium rendering")
+                    rendered_domains.add(domain)
+    return Fetched(html, etag, last_modified, False)
+
+# --- Parse Page ---
+# Each page is parsed once with lxml; title, main-content text and outbound
+# links all come from the same tree. bench_parse.py compares this with the old BeautifulSoup
+# path that parsed every page twice.
+HTML_PARSER = lxml.html.HTMLParser(encoding='utf-8')
+# Bump whenever process_page() output changes (text extraction, keywords,
+# link scoring) so PageCache entries made by the old code are re-parsed
+PARSE_VERSION = 3
+NON_TEXT_TAGS = ('script', 'style', 'template', etree.Comment, etree.ProcessingInstruction)
+
+# --- URL Canonicalization ---
+# canonicalize_url() gives the form that is queued and fetched: lowercase
+# scheme and host, no default port, no fragment or session id, tracking
+# parameters removed and the rest sorted. url_key() additionally folds
+# http/https, "www." and a trailing slash; it is only used for dedup, so the
+# variant that gets fetched is still one the server actually linked.
+SESSION_PATH_RE = re.compile(r';(jsessionid|phpsessid|sid)=[^/?#]*', re.I)
+
+@lru_cache(maxsize=None)
+def query_strip_re(domain):
+    patterns = list(STRIP_QUERY_PARAMS)
+    for rule_domain, extra in STRIP_QUERY_PARAMS_BY_DOMAIN.items():
+        if domain == rule_domain or domain.endswith("." + rule_domain):
+            patterns.extend(extra)
+    return re.compile("|".join(f"(?:{p})" for p in patterns), re.I)
+
+def canonicalize_url(url):
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    # Host as written, so IPv6 literals keep their brackets
+    host = parts.netloc.rpartition("@")[2].lower()
+    if parts.port is not None or host.endswith(":"):
+        host = host.rpartition(":")[0]
+    host = host.rstrip(".")
+    port = parts.port if parts.port and (scheme, parts.port) not in (("http", 80), ("https", 443)) else None
+    netloc = f"{host}:{port}" if port else host
+    path = SESSION_PATH_RE.sub('', parts.path) or "/"
+    strip_re = query_strip_re(host.replace("www.", ""))
+    # Bare flags (?print) stay bare rather than turning into ?print=
+    params = []
+    for field in parts.query.split("&"):
+        key, eq, value = field.partition("=")
+        key, value = unquote_plus(key), unquote_plus(value)
+        if key and not strip_re.search(key):
+            params.append((key, eq, value))
+    query = "&".join(quote_plus(k) + (f"={quote_plus(v)}" if eq else "") for k, eq, v in sorted(params))
+    return urlunsplit((scheme, netloc, path, query, ""))
+
+def url_key(url):
+    parts = urlsplit(canonicalize_url(url))
+    host = parts.netloc[4:] if parts.netloc.startswith("www.") else parts.netloc
+    path = parts.path.rstrip("/") or "/"
+    return urlunsplit(("", host, path, parts.query, ""))
+
+# Returns {canonical absolute_url: anchor text}; anchors of repeated links
+# are joined. Links to images, media, archives etc. (SKIP_LINK_EXT_RE) are
+# left out.
+def extract_links(tree, base_url):
+    links = {}
+    for a in tree.xpath('//a[@href]'):
+        abs_url = urljoin(base_url, a.get('href').strip())
         if abs_url.startswith("http"):
-            links.add(abs_url)
+            try:
+                abs_url = canonicalize_url(abs_url)
+            except ValueError:
+                continue
+            if SKIP_LINK_EXT_RE.search(urlsplit(abs_url).path):
+                continue
+            anchor = ' '.join(a.text_content().split())
+            links[abs_url] = f"{links[abs_url]} {anchor}" if links.get(abs_url) else anchor
     return links
 
-# --- Main Crawler ---
-def crawl(start_urls, max_pages=200, max_depth=3):
-    visited = set()
-    results = []
-    q = queue.Queue()
-    for url in start_urls:
-        q.put((url, 0))
-
-    while not q.empty() and len(visited) < max_pages:
-        url, depth = q.get()
-        if url in visited or depth > max_depth:
-            continue
-        visited.add(url)
+# --- Main Content Extraction ---
+# Readability-style: drop elements that are boilerplate by tag or by
+# class/id/role, then score the remaining blocks by the paragraph text they
+# hold, penalized by link density, and keep the best one. Menus, footers and
+# cookie banners never reach storage, the keyword filter or the NLP models.
+# Wrappers holding <main>/<article> are never dropped by class/id, and when
+# the result is still under MIN_MAIN_TEXT the page is re-parsed without the
+# class/id pass (class names like "has-sidebar" or "social-share-enabled"
+# sit on whole-page wrappers too).
+BOILERPLATE_TAGS = ('nav', 'footer', 'aside', 'noscript', 'iframe', 'svg', 'button', 'select', 'dialog')
+# Usually boilerplate, but ASP.NET/SharePoint pages wrap the whole body in a
+# <form> (and some themes put the page in a <header>), so these only go when
+# they hold little text (under MIN_MAIN_TEXT and under half the page's) and
+# no main/article node
+WRAPPER_TAGS = ('form', 'header')
+UNLIKELY_RE = re.compile(
+    r'-ad-|banner|breadcrumb|combx|comment|community|consent|cookie|disqus|footer|gdpr|'
+    r'header|menu|modal|navbar|navigation|newsletter|pager|pagination|popup|promo|related|'
+    r'share|shoutbox|sidebar|skip|social|sponsor|subscribe|toolbar|complementary|contentinfo', re.I)
+MAYBE_CONTENT_RE = re.compile(r'and|article|body|column|content|main|shadow', re.I)
+MAIN_XPATH = '//main | //article | //*[@role="main"]'
+HOLDS_MAIN_XPATH = 'boolean(descendant-or-self::main | descendant-or-self::article | descendant-or-self::*[@role="main"])'
+SCORED_TAGS = ('p', 'li', 'td', 'pre', 'blockquote', 'dd')
 
-        html = get_page_content(url)
-        if not html:
+def strip_boilerplate(tree, by_attrs=True):
+    etree.strip_elements(tree, *BOILERPLATE_TAGS, with_tail=False)
+    page_len = len(tree.text_content().strip())
+    for el in list(tree.iter(*WRAPPER_TAGS)):
+        text_len = len(el.text_content().strip())
+        if (el.getparent() is not None and not el.xpath(HOLDS_MAIN_XPATH)
+                and text_len < MIN_MAIN_TEXT and 2 * text_len < page_len):
+            el.drop_tree()
+    if not by_attrs:
+        return
+    for el in tree.xpath('//body//*[@class or @id or @role]'):
+        attrs = f"{el.get('class', '')} {el.get('id', '')} {el.get('role', '')}"
+        if (UNLIKELY_RE.search(attrs) and not MAYBE_CONTENT_RE.search(attrs)
+                and el.getparent() is not None and not el.xpath(HOLDS_MAIN_XPATH)):
+            el.drop_tree()
+
+def link_density(el, text_len):
+    link_len = sum(len(a.text_content()) for a in el.iter('a'))
+    return link_len / text_len if text_len else 1.0
+
+def main_content(tree):
+    body = tree.find('body')
+    if body is None:
+        return tree
+    for el in tree.xpath(MAIN_XPATH):
+        if len(el.text_content().strip()) >= MIN_MAIN_TEXT:
+            return el
+
+    scores = {}
+    for el in body.iter(*SCORED_TAGS):
+        text = el.text_content().strip()
+        if len(text) < 25:
             continue
+        score = 1 + text.count(',') + min(len(text) // 100, 3)
+        parent = el.getparent()
+        if parent is not None:
+            scores[parent] = scores.get(parent, 0) + score
+            grandparent = parent.getparent()
+            if grandparent is not None:
+                scores[grandparent] = scores.get(grandparent, 0) + score / 2
+
+    best, best_score = None, 0
+    for el, score in scores.items():
+        text_len = len(el.text_content().strip())
+        score *= 1 - link_density(el, text_len)
+        if score > best_score:
+            best, best_score = el, score
+    if best is None or len(best.text_content().strip()) < MIN_MAIN_TEXT:
+        return body
+    return best
+
+def page_text(tree, by_attrs=True):
+    etree.strip_elements(tree, *NON_TEXT_TAGS, with_tail=False)
+    strip_boilerplate(tree, by_attrs)
+    content = main_content(tree)
+    return '\n'.join(t.strip() for t in content.itertext() if t.strip())
+
+def parse_page(html, base_url):
+    data = html.encode('utf-8', 'replace')
+    try:
+        tree = lxml.html.document_fromstring(data, parser=HTML_PARSER)
+    except (etree.ParserError, ValueError):
+        return '', '', {}
+    title_el = tree.find('.//title')
+    title = title_el.text_content().strip() if title_el is not None else ''
+    # Links come from the full page: navigation is boilerplate to the text
+    # but still how the crawler finds the next pages
+    links = extract_links(tree, base_url)
+    text = page_text(tree)
+    if len(text) < MIN_MAIN_TEXT:
+        fallback = page_text(lxml.html.document_fromstring(data, parser=HTML_PARSER), by_attrs=False)
+        if len(fallback) > len(text):
+            text = fallback
+    return title, text, links
+
+# --- Keyword Matching ---
+# Aho-Corasick automaton over characters: the text is scanned once however
+# many keywords there are. Phrases match across any run of whitespace
+# (including the line breaks parse_page puts between blocks), and a match
+# only counts when it starts and, unless the keyword ends in *, ends on a
+# word boundary.
+WHITESPACE_RE = re.compile(r'\s+')
+
+class KeywordMatcher:
+    def __init__(self, keywords):
+        self.goto = [{}]
+        self.fail = [0]
+        self.out = [[]]
+        for kw in keywords:
+            pattern = ' '.join(kw.rstrip('*').lower().split())
+            state = 0
+            for ch in pattern:
+                nxt = self.goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(self.goto)
+                    self.goto.append({})
+                    self.fail.append(0)
+                    self.out.append([])
+                    self.goto[state][ch] = nxt
+                state = nxt
+            self.out[state].append((kw, len(pattern), kw.endswith('*')))
+
+        # Breadth-first so every node's fail link is set before its children's
+        pending = deque(self.goto[0].values())
+        while pending:
+            state = pending.popleft()
+            for ch, child in self.goto[state].items():
+                pending.append(child)
+                f = self.fail[state]
+                while f and ch not in self.goto[f]:
+                    f = self.fail[f]
+                self.fail[child] = self.goto[f].get(ch, 0)
+                self.out[child] = self.out[child] + self.out[self.fail[child]]
+
+    # Returns {keyword: number of matches}; empty when nothing matched
+    def count(self, text):
+        text = WHITESPACE_RE.sub(' ', text.lower())
+        goto, fail, out, root = self.goto, self.fail, self.out, self.goto[0]
+        counts = {}
+        state = 0
+        last = len(text) - 1
+        for i, ch in enumerate(text):
+            if not state and ch not in root:
+                continue
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            for kw, length, stem in out[state]:
+                start = i - length + 1
+                if start > 0 and text[start - 1].isalnum():
+                    continue
+                if not stem and i < last and text[i + 1].isalnum():
+                    continue
+                counts[kw] = counts.get(kw, 0) + 1
+        return counts
+
+keyword_matcher = KeywordMatcher(KEYWORDS)
+
+# --- Link Scoring ---
+# Priority of a discovered link for the best-first frontier: keyword hits in
+# its anchor text and URL (path and query split into words, so
+# /vocational-rehabilitation/ reads as a phrase), plus the keyword density of
+# the page that links to it.
+URL_SPLIT_RE = re.compile(r'[/_\-.+=&?%]+')
+
+def keyword_density(text, hits):
+    words = len(text.split())
+    return 100.0 * sum(hits.values()) / words if words else 0.0
 
-        soup = BeautifulSoup(html, 'html.parser')
-        title = soup.title.string.strip() if soup.title else ''
-        text = soup.get_text(separator='\n', strip=True)
+def score_link(url, anchor, parent_density):
+    parts = urlparse(url)
+    url_words = URL_SPLIT_RE.sub(' ', f"{parts.path} {parts.query}")
+    anchor_hits = sum(keyword_matcher.count(anchor).values()) if anchor else 0
+    url_hits = sum(keyword_matcher.count(url_words).values())
+    return ANCHOR_WEIGHT * anchor_hits + URL_WEIGHT * url_hits + PARENT_WEIGHT * min(parent_density, 10.0)
 
-        keywords = ["autism", "employment", "program", "effectiveness", "outcome", "evaluation"]
-        if not any(kw in text.lower() for kw in keywords):
+# Runs in the parser processes: everything CPU-bound about a page happens
+# here so the event loop only shuttles HTML out and results back. Links come
+# back as {url: score}.
+def process_page(html, base_url):
+    title, text, anchors = parse_page(html, base_url)
+    hits = keyword_matcher.count(text)
+    density = keyword_density(text, hits)
+    links = {url: score_link(url, anchor, density) for url, anchor in anchors.items()}
+    return title, text, links, bool(hits)
+
+# --- Shared HTTP Session ---
+# One client for the whole crawl so TCP/TLS connections to the same .gov hosts
+# are kept alive and reused. Per-host concurrency is already capped by the
+# scheduler, so the pool limits here only bound the total number of sockets.
+def make_client():
+    limits = httpx.Limits(max_connections=HTTP_MAX_CONNECTIONS,
+                          max_keepalive_connections=HTTP_KEEPALIVE_CONNECTIONS,
+                          keepalive_expiry=HTTP_KEEPALIVE_EXPIRY)
+    return httpx.AsyncClient(http2=HTTP2_AVAILABLE, limits=limits, timeout=HTTP_TIMEOUT,
+                             follow_redirects=True, headers={"User-Agent": USER_AGENT})
+
+# --- robots.txt ---
+# Rules are fetched once per origin (scheme + host) and kept for ROBOTS_TTL.
+# As RFC 9309 asks, a missing robots.txt (4xx) allows everything and an
+# unreachable one (5xx after retries, network error) disallows everything
+# until ROBOTS_ERROR_TTL passes. allowed() answers from the cache without
+# any I/O, so links to hosts we already know are filtered before they are
+# queued; check() fetches the rules first when needed, with one fetch per
+# origin shared by all workers. Both return None rather than False while a
+# host's robots.txt is unreachable, so callers can retry its URLs later
+# instead of treating them as disallowed.
+class RobotsCache:
+    def __init__(self, user_agent=USER_AGENT, ttl=ROBOTS_TTL, error_ttl=ROBOTS_ERROR_TTL):
+        self.user_agent = user_agent
+        self.ttl = ttl
+        self.error_ttl = error_ttl
+        self.rules = {}  # origin -> (RobotFileParser, expires, reachable)
+        self.fetching = {}  # origin -> task fetching its robots.txt
+
+    @staticmethod
+    def origin(url):
+        parts = urlsplit(url)
+        return f"{parts.scheme}://{parts.netloc}"
+
+    def _cached(self, origin):
+        entry = self.rules.get(origin)
+        if entry is None or entry[1] < time.monotonic():
+            return None
+        return entry[0]
+
+    def _verdict(self, origin, url):
+        rules, _, reachable = self.rules[origin]
+        return rules.can_fetch(self.user_agent, url) if reachable else None
+
+    # True/False from the cached rules, None if the origin isn't known yet
+    # or its robots.txt is unreachable
+    def allowed(self, url):
+        origin = self.origin(url)
+        return None if self._cached(origin) is None else self._verdict(origin, url)
+
+    # Like allowed(), but fetches the rules first; None only if unreachable
+    async def check(self, client, url):
+        origin = self.origin(url)
+        if self._cached(origin) is None:
+            task = self.fetching.get(origin)
+            if task is None:
+                task = self.fetching[origin] = asyncio.ensure_future(self._fetch(client, origin))
+                task.add_done_callback(lambda _: self.fetching.pop(origin, None))
+            await task
+        return self._verdict(origin, url)
+
+    def sitemaps(self, url):
+        rules = self._cached(self.origin(url))
+        return (rules.site_maps() or []) if rules is not None else []
+
+    # Seconds between requests asked for by Crawl-delay or Request-rate
+    def delay(self, url):
+        rules = self._cached(self.origin(url))
+        if rules is None:
+            return 0
+        delay = rules.crawl_delay(self.user_agent) or 0
+        rate = rules.request_rate(self.user_agent)
+        if rate and rate.requests:
+            delay = max(delay, rate.seconds / rate.requests)
+        return min(float(delay), ROBOTS_MAX_CRAWL_DELAY)
+
+    async def _fetch(self, client, origin):
+        rules = urllib.robotparser.RobotFileParser(f"{origin}/robots.txt")
+        ttl = self.ttl
+        reachable = True
+        try:
+            _, body, _ = await fetch_static(client, rules.url, max_bytes=4 * ROBOTS_MAX_BYTES)
+            if body is None:
+                raise ValueError("robots.txt too large")
+            text = body[:ROBOTS_MAX_BYTES].decode('utf-8', errors='replace')
+            rules.parse(text.splitlines())
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code < 500:
+                rules.allow_all = True
+            else:
+                rules.disallow_all = True
+                ttl = self.error_ttl
+                reachable = False
+        except Exception as e:
+            logging.warning(f"Could not fetch {rules.url}, skipping host for now: {e}")
+            rules.disallow_all = True
+            ttl = self.error_ttl
+            reachable = False
+        self.rules[origin] = (rules, time.monotonic() + ttl, reachable)
+        return rules
+
+# --- Sitemap Seeding ---
+# Sitemaps listed in robots.txt (or /sitemap.xml when it lists none) are
+# parsed incrementally while they download, gunzipping on the fly, and
+# parsed elements are freed straight away, so even a large gzipped index
+# never sits in memory whole. Nested indexes are followed up to
+# SITEMAP_MAX_FILES per site. Page entries whose URL scores on the
+# keywords and whose lastmod (when given) is within SITEMAP_MAX_AGE_DAYS
+# go straight to enqueue() as they are parsed, scored like links. Each
+# sitemap file is fetched in its host's scheduler slot, so it counts
+# against the same rate and Crawl-delay as the host's pages.
+#
+# lastmod is a W3C datetime (YYYY, YYYY-MM, YYYY-MM-DD or a full timestamp
+# with "Z" or an offset). Parsed by hand: datetime.fromisoformat() only
+# accepts "Z" and most fraction lengths from Python 3.11 on.
+W3C_DATETIME_RE = re.compile(
+    r'(\d{4})(?:-(\d{2})(?:-(\d{2})(?:T(\d{2}):(\d{2})(?::(\d{2})(?:\.\d+)?)?'
+    r'(Z|[+-]\d{2}:\d{2})?)?)?)?$')
+
+def parse_lastmod(value):
+    match = W3C_DATETIME_RE.match(value.strip())
+    if match is None:
+        return None
+    year, month, day, hour, minute, second, zone = match.groups()
+    tz = timezone.utc
+    if zone and zone != 'Z':
+        offset = timedelta(hours=int(zone[1:3]), minutes=int(zone[4:6]))
+        tz = timezone(-offset if zone[0] == '-' else offset)
+    try:
+        return datetime(int(year), int(month or 1), int(day or 1), int(hour or 0),
+                        int(minute or 0), int(second or 0), tzinfo=tz)
+    except ValueError:
+        return None
+
+# Hands each <url>/<sitemap> entry parsed so far to on_entry(kind, loc,
+# lastmod); False if on_entry asked to stop
+def read_sitemap_entries(parser, on_entry):
+    for _, elem in parser.read_events():
+        kind = etree.QName(elem).localname
+        if kind not in ('url', 'sitemap'):
             continue
+        loc = (elem.findtext('{*}loc') or '').strip()
+        lastmod = elem.findtext('{*}lastmod')
+        elem.clear()
+        while elem.getprevious() is not None:
+            del elem.getparent()[0]
+        if on_entry(kind, loc, parse_lastmod(lastmod) if lastmod else None) is False:
+            return False
+    return True
+
+async def read_sitemap(client, url, on_entry):
+    parser = etree.XMLPullParser(events=('end',), resolve_entities=False, no_network=True)
+    inflate = None
+    size = 0
+    async with client.stream("GET", url) as resp:
+        resp.raise_for_status()
+        async for chunk in resp.aiter_bytes():
+            # .xml.gz files usually come without Content-Encoding, so httpx
+            # hands over the raw gzip stream
+            if inflate is None:
+                inflate = zlib.decompressobj(16 + zlib.MAX_WBITS) if chunk[:2] == b'\x1f\x8b' else False
+            if inflate:
+                chunk = inflate.decompress(chunk, SITEMAP_MAX_BYTES - size + 1)
+            size += len(chunk)
+            if size > SITEMAP_MAX_BYTES:
+                raise ValueError(f"larger than {SITEMAP_MAX_BYTES} bytes")
+            parser.feed(chunk)
+            if not read_sitemap_entries(parser, on_entry):
+                return
+    parser.close()
+    read_sitemap_entries(parser, on_entry)
+
+# Returns the number of entries passed to enqueue(url, depth, score).
+# robots is always read for its Sitemap: lines; its rules only apply with
+# obey_robots.
+async def seed_site_from_sitemaps(client, origin, enqueue, scheduler, robots, obey_robots=True):
+    await robots.check(client, f"{origin}/")
+    todo = deque(robots.sitemaps(origin) or [f"{origin}/sitemap.xml"])
+    queued_files = set(todo)
+    cutoff = datetime.now(timezone.utc) - timedelta(days=SITEMAP_MAX_AGE_DAYS) if SITEMAP_MAX_AGE_DAYS else None
+    added = 0
+
+    def on_entry(kind, loc, lastmod):
+        nonlocal added
+        if not loc.startswith("http") or (cutoff and lastmod and lastmod < cutoff):
+            return True
+        if kind == 'sitemap':
+            if loc not in queued_files:
+                queued_files.add(loc)
+                todo.append(loc)
+            return True
+        try:
+            url = canonicalize_url(loc)
+        except ValueError:
+            return True
+        score = score_link(url, "", 0)
+        if score > 0:
+            enqueue(url, 0, score)
+            added += 1
+        return added < SITEMAP_MAX_URLS
+
+    files = 0
+    while todo and files < SITEMAP_MAX_FILES and added < SITEMAP_MAX_URLS:
+        url = todo.popleft()
+        host = get_domain(url)
+        if obey_robots:
+            if not await robots.check(client, url):
+                continue
+            scheduler.set_delay(host, robots.delay(url))
+        files += 1
+        try:
+            async with scheduler.slot(host):
+                await read_sitemap(client, url, on_entry)
+        except httpx.HTTPStatusError as e:
+            # Most sites without a robots.txt Sitemap: line have no /sitemap.xml either
+            logging.info(f"Skipping sitemap {url}: HTTP {e.response.status_code}")
+        except Exception as e:
+            logging.warning(f"Skipping sitemap {url}: {e}")
+    if added:
+        logging.info(f"Seeded {added} URLs from {files} sitemap file(s) of {origin}")
+    return added
+
+async def seed_from_sitemaps(client, start_urls, enqueue, scheduler, robots=None):
+    # Sitemap: lines are read even when robots.txt rules are being ignored
+    obey_robots = robots is not None
+    robots = robots or RobotsCache()
+    origins = dict.fromkeys(RobotsCache.origin(url) for url in start_urls)
+    counts = await asyncio.gather(*(seed_site_from_sitemaps(client, origin, enqueue, scheduler,
+                                                            robots, obey_robots)
+                                    for origin in origins))
+    return sum(counts)
+
+# --- Per-Host Scheduler ---
+# Best-first frontier with politeness. Each host has a heap of URLs ordered
+# by link score (then depth, then arrival, so equal scores stay breadth-
+# first). Hosts whose next request slot is still in the future wait in a
+# heap of (ready_time, host); hosts that may be fetched now sit in a heap
+# keyed by the score of their best URL. Workers always get the most
+# promising URL among the hosts that are ready, so many hosts are fetched in
+# parallel while each one sees at most `rate` requests/second. Each ready
+# host has one current entry in `available` (its seq in available_seq);
+# older entries are skipped when popped, and the heap is rebuilt once they
+# outnumber the ready hosts.
+#
+# At most `max_size` URLs are queued. When full, "drop-new" rejects the
+# incoming URL and "drop-lowest" evicts the lowest-scored queued URL if the
+# new one scores higher. Queued URLs live in `live` (seq -> host heap
+# entry); heap entries whose seq has left it are skipped lazily, and each
+# heap is rebuilt from `live` once stale entries make up half of it, so
+# memory stays proportional to max_size. `lowest` is only kept for
+# "drop-lowest" with a max_size.
+#
+# set_delay() slows a single host down (robots.txt Crawl-delay); it never
+# makes a host faster than `rate`. slot() lets a request made outside get()
+# (a sitemap file) take the host's next slot; the host is handed out to no
+# worker until that request is done.
+class HostScheduler:
+    def __init__(self, rate=PER_HOST_RATE, max_size=MAX_FRONTIER, overflow=FRONTIER_OVERFLOW):
+        self.interval = 1.0 / rate
+        self.max_size = max_size
+        self.overflow = overflow
+        self.queues = {}
+        self.waiting = []
+        self.available = []
+        self.available_seq = {}
+        self.next_time = {}
+        self.host_interval = {}
+        self.live = {}
+        self.lowest = []
+        self.stale = {}
+        self.busy = set()
+        self.pending = 0
+        self.closed = False
+        self._seq = itertools.count()
+        self._wakeup = asyncio.Event()
+
+    # Returns the URL that did not make it into the frontier (the new one or
+    # an evicted one), or None if nothing was dropped
+    def put(self, url, depth, score=0.0):
+        dropped = None
+        if self.max_size and len(self.live) >= self.max_size:
+            if self.overflow != "drop-lowest":
+                return url
+            victim = self._pop_lowest(score)
+            if victim is None:
+                return url
+            dropped = victim
+
+        host = get_domain(url)
+        seq = next(self._seq)
+        entry = (-score, depth, seq, url)
+        self.live[seq] = entry
+        if self.max_size and self.overflow == "drop-lowest":
+            heapq.heappush(self.lowest, (score, -depth, seq))
+            if len(self.lowest) > 2 * len(self.live) + 16:
+                self.lowest = [(-e[0], -e[1], e[2]) for e in self.live.values()]
+                heapq.heapify(self.lowest)
+        if host not in self.queues:
+            self.queues[host] = [entry]
+            now = asyncio.get_running_loop().time()
+            heapq.heappush(self.waiting, (max(self.next_time.get(host, now), now), host))
+        else:
+            heapq.heappush(self.queues[host], entry)
+            if host in self.available_seq and self.queues[host][0] is entry:
+                # Better than the host's previous best; replaces its entry
+                self._push_available(host)
+        self.pending += 1
+        self._wakeup.set()
+        return dropped
+
+    def _pop_lowest(self, score):
+        while self.lowest:
+            low_score, _, seq = self.lowest[0]
+            if seq not in self.live:
+                heapq.heappop(self.lowest)
+                continue
+            if low_score >= score:
+                return None
+            heapq.heappop(self.lowest)
+            self.pending -= 1
+            return self._evict(seq)
+        return None
+
+    def _evict(self, seq):
+        url = self.live.pop(seq)[3]
+        host = get_domain(url)
+        queue = self.queues[host]
+        stale = self.stale.get(host, 0) + 1
+        if stale > len(queue) // 2:
+            queue[:] = [e for e in queue if e[2] in self.live]
+            heapq.heapify(queue)
+            stale = 0
+        self.stale[host] = stale
+        return url
+
+    def _clean(self, host):
+        # Drops evicted entries from the top of a host's heap; False if empty
+        queue = self.queues[host]
+        while queue and queue[0][2] not in self.live:
+            heapq.heappop(queue)
+            self.stale[host] -= 1
+        if not queue:
+            del self.queues[host]
+            self.stale.pop(host, None)
+            self.available_seq.pop(host, None)
+            return False
+        return True
+
+    def _push_available(self, host):
+        seq = next(self._seq)
+        self.available_seq[host] = seq
+        heapq.heappush(self.available, (self.queues[host][0][0], seq, host))
+        if len(self.available) > 2 * len(self.available_seq) + 16:
+            self._compact_available()
+
+    def _compact_available(self):
+        self.available = []
+        for host in list(self.available_seq):
+            if self._clean(host):
+                seq = next(self._seq)
+                self.available_seq[host] = seq
+                self.available.append((self.queues[host][0][0], seq, host))
+        heapq.heapify(self.available)
+
+    def set_delay(self, host, delay):
+        old = self.host_interval.get(host, self.interval)
+        new = max(self.interval, delay)
+        if new == old:
+            return
+        self.host_interval[host] = new
+        if host in self.next_time:
+            # Push back the slot already handed out; get() re-queues the
+            # host's waiting entry when it finds it is now early
+            self.next_time[host] += new - old
+
+    # Keeps a host's slot busy for the next `seconds`, e.g. while its
+    # robots.txt can't be reached
+    def hold(self, host, seconds):
+        until = asyncio.get_running_loop().time() + seconds
+        self.next_time[host] = max(self.next_time.get(host, until), until)
+
+    @asynccontextmanager
+    async def slot(self, host):
+        loop = asyncio.get_running_loop()
+        while host in self.busy:
+            await asyncio.sleep(self.interval)
+        # Reserved first so workers can't keep taking the slot while we wait
+        self.busy.add(host)
+        try:
+            while self.next_time.get(host, 0) > loop.time():
+                await asyncio.sleep(self.next_time[host] - loop.time())
+            yield
+        finally:
+            self.busy.discard(host)
+            self.next_time[host] = loop.time() + self.host_interval.get(host, self.interval)
+            # Back to waiting for its next slot; get() dropped or would
+            # otherwise skip its entries
+            self.available_seq.pop(host, None)
+            if host in self.queues:
+                heapq.heappush(self.waiting, (self.next_time[host], host))
+                self._wakeup.set()
+
+    def task_done(self):
+        self.pending -= 1
+        if self.pending == 0:
+            self._wakeup.set()
+
+    def close(self):
+        # Stop handing out URLs even though some are still queued
+        self.closed = True
+        self._wakeup.set()
+
+    def _pop_available(self):
+        while self.available:
+            neg_score, seq, host = heapq.heappop(self.available)
+            if self.available_seq.get(host) != seq or not self._clean(host):
+                continue
+            if host in self.busy:
+                # slot() puts it back in `waiting` when it is done
+                del self.available_seq[host]
+                continue
+            if self.queues[host][0][0] == neg_score:
+                del self.available_seq[host]
+                return host
+            # The host's best URL was evicted; requeue it under its new best
+            self._push_available(host)
+        return None
+
+    async def get(self):
+        # Returns None once every queued URL has been processed or on close()
+        loop = asyncio.get_running_loop()
+        while self.pending and not self.closed:
+            now = loop.time()
+            while self.waiting and self.waiting[0][0] <= now:
+                ready, host = heapq.heappop(self.waiting)
+                if host in self.busy:
+                    continue
+                if ready < self.next_time.get(host, ready):
+                    heapq.heappush(self.waiting, (self.next_time[host], host))
+                    continue
+                if self._clean(host):
+                    self._push_available(host)
+
+            host = self._pop_available()
+            if host is not None:
+                neg_score, depth, seq, url = heapq.heappop(self.queues[host])
+                del self.live[seq]
+                self.next_time[host] = now + self.host_interval.get(host, self.interval)
+                if self._clean(host):
+                    heapq.heappush(self.waiting, (self.next_time[host], host))
+                return url, depth, -neg_score
+
+            delay = self.waiting[0][0] - now if self.waiting else None
+            self._wakeup.clear()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), delay)
+            except asyncio.TimeoutError:
+                pass
+        return None
+
+# --- SQLite Stores ---
+# Common setup of the on-disk stores (frontier, page cache, NLP cache,
+# document cache): WAL so a read never waits on the writer, and
+# synchronous=NORMAL since a lost last transaction only means redoing a
+# little work.
+class SQLiteStore:
+    def __init__(self, path, row_factory=None):
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        self.db = sqlite3.connect(path)
+        if row_factory is not None:
+            self.db.row_factory = row_factory
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute("PRAGMA synchronous=NORMAL")
+
+    def commit(self):
+        self.db.commit()
+
+    def close(self):
+        self.db.commit()
+        self.db.close()
+
+# --- Persistent Frontier ---
+# SQLite record of every queued URL with its depth and whether it has been
+# processed. A crawl that dies part-way resumes from here; URLs that were in
+# flight at the crash are still pending and get fetched again. Pages already
+# kept are on disk in index.csv, which PageWriter appends to on resume.
+class FrontierStore(SQLiteStore):
+    def __init__(self, path=None):
+        super().__init__(path or frontier_path)
+        self.db.executescript("""
+            CREATE TABLE IF NOT EXISTS frontier (
+                url TEXT PRIMARY KEY, depth INTEGER NOT NULL, done INTEGER NOT NULL DEFAULT 0,
+                score REAL NOT NULL DEFAULT 0);
+        """)
+        columns = {row[1] for row in self.db.execute("PRAGMA table_info(frontier)")}
+        if "score" not in columns:
+            self.db.execute("ALTER TABLE frontier ADD COLUMN score REAL NOT NULL DEFAULT 0")
+
+    def is_empty(self):
+        return self.db.execute("SELECT 1 FROM frontier LIMIT 1").fetchone() is None
+
+    def add(self, url, depth, score=0.0):
+        self.db.execute("INSERT OR IGNORE INTO frontier (url, depth, score) VALUES (?, ?, ?)",
+                        (url, depth, score))
+
+    def remove(self, url):
+        self.db.execute("DELETE FROM frontier WHERE url = ? AND done = 0", (url,))
+
+    def mark_done(self, url):
+        self.db.execute("UPDATE frontier SET done = 1 WHERE url = ?", (url,))
+
+    def pending(self):
+        return self.db.execute("SELECT url, depth, score FROM frontier WHERE done = 0 ORDER BY rowid")
+
+    def done_urls(self):
+        return (url for url, in self.db.execute("SELECT url FROM frontier WHERE done = 1"))
+
+    def clear(self):
+        self.db.execute("DELETE FROM frontier")
+        self.db.commit()
+
+# --- Recrawl Cache ---
+# Survives between scheduled runs (unlike FrontierStore): per-URL validators,
+# a hash of the fetched HTML and the parse results, so a 304 or byte-identical
+# page skips parsing. Rows written by another PARSE_VERSION are treated as
+# missing, so parser changes reach unchanged pages too. NLP output is cached
+# separately by NLPCache.
+class PageCache(SQLiteStore):
+    def __init__(self, path=None):
+        super().__init__(path or page_cache_path, row_factory=sqlite3.Row)
+        self.db.execute("""
+            CREATE TABLE IF NOT EXISTS pages (
+                url TEXT PRIMARY KEY, etag TEXT, last_modified TEXT, content_hash TEXT,
+                title TEXT, text TEXT, links TEXT, hit INTEGER, fetched_at REAL,
+                parse_version INTEGER)
+        """)
+        columns = {row[1] for row in self.db.execute("PRAGMA table_info(pages)")}
+        if "parse_version" not in columns:
+            self.db.execute("ALTER TABLE pages ADD COLUMN parse_version INTEGER")
+
+    def get(self, url):
+        return self.db.execute("SELECT * FROM pages WHERE url = ? AND parse_version = ?",
+                               (url, PARSE_VERSION)).fetchone()
+
+    def put(self, url, etag, last_modified, content_hash, title, text, links, hit):
+        self.db.execute(
+            """INSERT INTO pages (url, etag, last_modified, content_hash, title, text, links, hit,
+                                  fetched_at, parse_version)
+               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+               ON CONFLICT(url) DO UPDATE SET
+                   etag = excluded.etag, last_modified = excluded.last_modified,
+                   content_hash = excluded.content_hash, title = excluded.title,
+                   text = excluded.text, links = excluded.links, hit = excluded.hit,
+                   fetched_at = excluded.fetched_at, parse_version = excluded.parse_version""",
+            (url, etag, last_modified, content_hash, title, text, json.dumps(links),
+             int(hit), time.time(), PARSE_VERSION))
+
+    def touch(self, url, etag, last_modified):
+        self.db.execute("UPDATE pages SET etag = ?, last_modified = ?, fetched_at = ? WHERE url = ?",
+                        (etag, last_modified, time.time(), url))
 
-        domain = urlparse(url).netloc.replace("www.", "")
-        results.append((url, title, domain, text))
-        logging.info(f"Crawled: {url} (depth {depth})")
+def content_hash(html):
+    return hashlib.sha256(html.encode('utf-8', 'replace')).hexdigest()
 
-        if depth < max_depth:
-            for link in extract_links(html, url):
-                if link not in visited:
-                    q.put((link, depth + 1))
-    return results
+def text_hash(text):
+    return hashlib.sha256(text.encode('utf-8', 'replace')).hexdigest()
+
+def cached_parse(cached):
+    return cached['title'], cached['text'], json.loads(cached['links']), bool(cached['hit'])
+
+# --- Visited / Seen URL Sets ---
+# The crawler's visited and seen sets need add(), discard(), `in` and len().
+# "memory" is a plain set of url_key()s. "bloom" and "disk" keep memory flat
+# for crawls of hundreds of thousands of URLs; bench_visited.py measures all
+# three.
+
+# Scalable Bloom filter (Almeida et al. 2007): when a filter reaches its
+# capacity a new one with twice the capacity and a tighter error rate is
+# added, so the overall false-positive rate stays under `error_rate` however
+# many keys arrive. A false positive makes the crawler skip a URL it never
+# fetched; discard() is a no-op since Bloom filters cannot delete.
+class ScalableBloomFilter:
+    def __init__(self, initial_capacity=BLOOM_INITIAL_CAPACITY, error_rate=BLOOM_ERROR_RATE):
+        self.initial_capacity = initial_capacity
+        self.error_rate = error_rate
+        self.filters = []
+        self.count = 0
+        self._add_filter()
+
+    def _add_filter(self):
+        n = len(self.filters)
+        capacity = self.initial_capacity * 2 ** n
+        # Tightening ratio 0.5: the per-filter errors sum to < error_rate
+        error = self.error_rate * 0.5 ** (n + 1)
+        num_bits = max(8, int(-capacity * math.log(error) / math.log(2) ** 2))
+        num_hashes = max(1, round(num_bits / capacity * math.log(2)))
+        self.filters.append({"bits": bytearray((num_bits + 7) // 8), "num_bits": num_bits,
+                             "num_hashes": num_hashes, "capacity": capacity, "count": 0})
+
+    @staticmethod
+    def _hashes(key):
+        digest = hashlib.blake2b(key.encode('utf-8'), digest_size=16).digest()
+        return int.from_bytes(digest[:8], 'little'), int.from_bytes(digest[8:], 'little') | 1
+
+    def _contains(self, h1, h2):
+        for f in self.filters:
+            bits, num_bits = f["bits"], f["num_bits"]
+            for i in range(f["num_hashes"]):
+                pos = (h1 + i * h2) % num_bits
+                if not bits[pos >> 3] & (1 << (pos & 7)):
+                    break
+            else:
+                return True
+        return False
+
+    def __contains__(self, key):
+        return self._contains(*self._hashes(key))
+
+    def add(self, key):
+        h1, h2 = self._hashes(key)
+        if self._contains(h1, h2):
+            return
+        f = self.filters[-1]
+        if f["count"] >= f["capacity"]:
+            self._add_filter()
+            f = self.filters[-1]
+        bits, num_bits = f["bits"], f["num_bits"]
+        for i in range(f["num_hashes"]):
+            pos = (h1 + i * h2) % num_bits
+            bits[pos >> 3] |= 1 << (pos & 7)
+        f["count"] += 1
+        self.count += 1
+
+    def discard(self, key):
+        pass
+
+    def __len__(self):
+        return self.count
+
+    def close(self):
+        pass
+
+# Exact set kept in SQLite; only SQLite's page cache is held in memory. The
+# crawl's durable state is the FrontierStore, so this file is rebuilt from
+# scratch each run and written without journaling or fsyncs.
+class DiskURLSet:
+    def __init__(self, path):
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        self.db = sqlite3.connect(path)
+        self.db.execute("PRAGMA journal_mode=OFF")
+        self.db.execute("PRAGMA synchronous=OFF")
+        self.db.execute("PRAGMA cache_size=-8192")  # 8 MB
+        self.db.execute("DROP TABLE IF EXISTS urls")
+        self.db.execute("CREATE TABLE urls (key TEXT PRIMARY KEY) WITHOUT ROWID")
+        self.count = 0
+
+    def __contains__(self, key):
+        return self.db.execute("SELECT 1 FROM urls WHERE key = ?", (key,)).fetchone() is not None
+
+    def add(self, key):
+        self.count += self.db.execute("INSERT OR IGNORE INTO urls (key) VALUES (?)", (key,)).rowcount
+
+    def discard(self, key):
+        self.count -= self.db.execute("DELETE FROM urls WHERE key = ?", (key,)).rowcount
+
+    def __len__(self):
+        return self.count
+
+    def close(self):
+        self.db.close()
+
+def make_url_set(name, backend=VISITED_BACKEND):
+    if backend == "bloom":
+        return ScalableBloomFilter()
+    if backend == "disk":
+        return DiskURLSet(os.path.join(output_dir, f"{name}.sqlite"))
+    if backend == "memory":
+        return set()
+    raise ValueError(f"Unknown visited backend: {backend}")
+
+# --- Main Crawler ---
+# A pool of `concurrency` workers pulls the most promising URL from the
+# per-host scheduler, so network waits overlap across hosts and max_pages /
+# max_depth still apply. Kept pages are handed to on_page(url, title, domain,
+# text) as soon as they are parsed instead of being collected in memory.
+# Fetched HTML is parsed in a process pool so parsing uses every core while
+# the other workers keep the network busy. With a FrontierStore the queue and
+# visited set (of url_key()s, so URL variants of one page are fetched once)
+# are persisted and a non-empty store is resumed instead of
+# starting again from start_urls. With a PageCache, pages that come
+# back 304 or byte-identical to the last crawl reuse the cached parse.
+# visited_backend picks how the visited and seen sets are stored. With
+# respect_robots, robots.txt rules filter links as they are enqueued (once
+# the host's rules are known) and again before every fetch, and a host's
+# Crawl-delay slows its scheduler slot down. With use_sitemaps, a fresh
+# crawl also seeds the frontier from the start sites' sitemaps while the
+# workers are already fetching. Document URLs (PDFs) are not parsed here but
+# handed to on_document(url, media_type, domain).
+async def crawl_async(start_urls, on_page, max_pages=200, max_depth=3, concurrency=CONCURRENCY,
+                      per_host_rate=PER_HOST_RATE, parse_workers=PARSE_WORKERS, store=None,
+                      page_cache=None, visited_backend=VISITED_BACKEND, respect_robots=RESPECT_ROBOTS,
+                      use_sitemaps=USE_SITEMAPS, on_document=None):
+    visited = make_url_set("visited", visited_backend)
+    seen = make_url_set("seen", visited_backend)
+    kept = 0
+    scheduler = HostScheduler(per_host_rate)
+    robots = RobotsCache() if respect_robots else None
+
+    # Dedup happens here, at enqueue time, so each URL is queued once and the
+    # frontier grows with unique URLs rather than with links found
+    def enqueue(url, depth, score):
+        key = url_key(url)
+        if key in seen:
+            return
+        if robots is not None and robots.allowed(url) is False:
+            return
+        dropped = scheduler.put(url, depth, score)
+        if dropped != url:
+            seen.add(key)
+            if store is not None:
+                store.add(url, depth, score)
+        if dropped is not None:
+            # Forget dropped URLs so a later, better-scored link can requeue them
+            seen.discard(url_key(dropped))
+            if store is not None and dropped != url:
+                store.remove(dropped)
+
+    # Puts back a URL that was handed out but not processed; it is already
+    # in seen and the store
+    def requeue(url, depth, score):
+        dropped = scheduler.put(url, depth, score)
+        if dropped is not None:
+            seen.discard(url_key(dropped))
+            if store is not None:
+                store.remove(dropped)
+
+    resuming = store is not None and not store.is_empty()
+    if resuming:
+        for url in store.done_urls():
+            visited.add(url_key(url))
+            seen.add(url_key(url))
+        pending = store.pending().fetchall()
+        logging.info(f"Resuming crawl: {len(visited)} URLs done, {len(pending)} pending")
+        for url, depth, score in pending:
+            seen.add(url_key(url))
+            scheduler.put(url, depth, score)
+        if len(visited) >= max_pages:
+            # The last run already reached max_pages; nothing left to fetch
+            scheduler.close()
+    else:
+        for url in start_urls:
+            enqueue(canonicalize_url(url), 0, SEED_SCORE)
+
+    loop = asyncio.get_running_loop()
+    parse_pool = ProcessPoolExecutor(parse_workers) if parse_workers else None
+
+    async def parse(html, url):
+        if parse_pool is None:
+            return process_page(html, url)
+        return await loop.run_in_executor(parse_pool, process_page, html, url)
+
+    async def worker(client):
+        nonlocal kept
+        while True:
+            item = await scheduler.get()
+            if item is None:
+                return
+            url, depth, score = item
+            claimed = False
+            try:
+                key = url_key(url)
+                if key in visited or depth > max_depth or len(visited) >= max_pages:
+                    claimed = depth > max_depth
+                    continue
+                if robots is not None:
+                    allowed = await robots.check(client, url)
+                    if allowed is None:
+                        # robots.txt unreachable: try again once its error TTL is up
+                        scheduler.hold(get_domain(url), robots.error_ttl)
+                        requeue(url, depth, score)
+                        continue
+                    if not allowed:
+                        logging.info(f"Disallowed by robots.txt: {url}")
+                        claimed = True
+                        continue
+                    scheduler.set_delay(get_domain(url), robots.delay(url))
+                    # Other workers may have run while robots.txt was fetched
+                    if key in visited or len(visited) >= max_pages:
+                        continue
+                visited.add(key)
+                claimed = True
+                if len(visited) >= max_pages:
+                    scheduler.close()
+
+                cached = page_cache.get(url) if page_cache is not None else None
+                fetched = await get_page_content(client, url, cached=cached)
+                if fetched is not None and fetched.document:
+                    if on_document is not None:
+                        on_document(url, fetched.document, get_domain(url))
+                    continue
+                if fetched is None or not (fetched.not_modified or fetched.html):
+                    continue
+
+                if fetched.not_modified or (cached and cached['content_hash'] == content_hash(fetched.html)):
+                    title, text, links, hit = cached_parse(cached)
+                    page_cache.touch(url, fetched.etag, fetched.last_modified)
+                else:
+                    title, text, links, hit = await parse(fetched.html, url)
+                    if page_cache is not None:
+                        page_cache.put(url, fetched.etag, fetched.last_modified,
+                                       content_hash(fetched.html), title, text, links, hit)
+                if not hit:
+                    continue
+
+                domain = get_domain(url)
+                on_page(url, title, domain, text)
+                kept += 1
+                logging.info(f"Crawled: {url} (depth {depth})")
+
+                if depth < max_depth:
+                    for link, score in links.items():
+                        enqueue(link, depth + 1, score)
+            except Exception as e:
+                logging.error(f"Failed to process {url}: {e}")
+            finally:
+                if store is not None and claimed:
+                    store.mark_done(url)
+                    store.commit()
+                if page_cache is not None and claimed:
+                    page_cache.commit()
+                scheduler.task_done()
+
+    async def seed_sitemaps(client):
+        try:
+            await seed_from_sitemaps(client, start_urls, enqueue, scheduler, robots)
+        except Exception as e:
+            logging.error(f"Sitemap seeding failed: {e}")
+        finally:
+            scheduler.task_done()
+
+    try:
+        async with make_client() as client:
+            sitemap_task = None
+            if use_sitemaps and not resuming:
+                # Counts as a pending task so idle workers wait for sitemap
+                # entries instead of exiting once the seeds are done
+                scheduler.pending += 1
+                sitemap_task = asyncio.ensure_future(seed_sitemaps(client))
+            await asyncio.gather(*(worker(client) for _ in range(concurrency)))
+            if sitemap_task is not None:
+                # Workers also stop at max_pages; the rest of the sitemaps is moot
+                sitemap_task.cancel()
+                await asyncio.gather(sitemap_task, return_exceptions=True)
+    finally:
+        driver_pool.close()
+        if parse_pool is not None:
+            parse_pool.shutdown()
+        if not isinstance(visited, set):
+            visited.close()
+            seen.close()
+    return kept
+
+# Returns the number of pages kept; the pages themselves go to on_page
+def crawl(start_urls, on_page, max_pages=200, max_depth=3, concurrency=CONCURRENCY,
+          per_host_rate=PER_HOST_RATE, parse_workers=PARSE_WORKERS, store=None,
+          page_cache=None, visited_backend=VISITED_BACKEND, respect_robots=RESPECT_ROBOTS,
+          use_sitemaps=USE_SITEMAPS, on_document=None):
+    return asyncio.run(crawl_async(start_urls, on_page, max_pages, max_depth, concurrency,
+                                   per_host_rate, parse_workers, store, page_cache,
+                                   visited_backend, respect_robots, use_sitemaps, on_document))
 
 # --- Seed URLs ---
 seed_urls = [
@@ -112,61 +1541,666 @@ seed_urls = [
     "https://www.nimh.nih.gov/health/topics/autism-spectrum-disorders-asd",
 ]
 
-results = crawl(seed_urls)
-
 # --- Save .txt and CSV Index ---
-with open(csv_path, mode='w', newline='', encoding='utf-8') as csvfile:
-    writer = csv.writer(csvfile)
-    writer.writerow(["URL", "Title", "Organization", "Filename"])
-    for i, (url, title, org, text) in enumerate(results, 1):
-        filename = f"page_{i}.txt"
+# Writes each page file and index row the moment the crawler keeps a page,
+# flushing as it goes, so nothing accumulates in memory and an interrupted
+# crawl leaves a usable index behind. With resume=True it appends to the
+# existing index and skips URLs that are already in it.
+class PageWriter:
+    def __init__(self, resume=False):
+        os.makedirs(txt_dir, exist_ok=True)
+        self.seen = set()
+        self.count = 0
+        if resume and os.path.exists(csv_path):
+            for row in iter_index_rows():
+                self.seen.add(row['URL'])
+                self.count += 1
+            self.csvfile = open(csv_path, mode='a', newline='', encoding='utf-8')
+            self.writer = csv.writer(self.csvfile)
+        else:
+            self.csvfile = open(csv_path, mode='w', newline='', encoding='utf-8')
+            self.writer = csv.writer(self.csvfile)
+            self.writer.writerow(["URL", "Title", "Organization", "Filename"])
+
+    def __call__(self, url, title, org, text):
+        if url in self.seen:
+            return
+        self.seen.add(url)
+        self.count += 1
+        filename = f"page_{self.count}.txt"
         filepath = os.path.join(txt_dir, filename)
         with open(filepath, 'w', encoding='utf-8') as f:
             f.write(text)
-        writer.writerow([url, title, org, filename])
+        self.writer.writerow([url, title, org, filename])
+        self.csvfile.flush()
 
-# --- NLP Analysis ---
-analysis_results = []
-for url, title, org, text in results:
+    # Like __call__, but the text arrives as an iterable of parts (PDF pages)
+    # written out as they come, so a long document is never held whole.
+    # keep(), asked once every part is written, can still discard it.
+    # Returns whether the document was kept.
+    def write_parts(self, url, title, org, parts, keep=None):
+        if url in self.seen:
+            return False
+        filename = f"page_{self.count + 1}.txt"
+        filepath = os.path.join(txt_dir, filename)
+        with open(filepath, 'w', encoding='utf-8') as f:
+            for i, part in enumerate(parts):
+                f.write(f"\n\n{part}" if i else part)
+        if keep is not None and not keep():
+            os.remove(filepath)
+            return False
+        self.seen.add(url)
+        self.count += 1
+        self.writer.writerow([url, title, org, filename])
+        self.csvfile.flush()
+        return True
+
+    def close(self):
+        self.csvfile.close()
+
+# Document URLs the crawl routed away from HTML parsing, one documents.csv
+# row each, for the document pipeline to pick up
+class DocumentLog:
+    def __init__(self, resume=False):
+        self.seen = set()
+        if resume and os.path.exists(documents_path):
+            with open(documents_path, newline='', encoding='utf-8') as f:
+                self.seen.update(row['URL'] for row in csv.DictReader(f))
+            self.csvfile = open(documents_path, mode='a', newline='', encoding='utf-8')
+            self.writer = csv.writer(self.csvfile)
+        else:
+            self.csvfile = open(documents_path, mode='w', newline='', encoding='utf-8')
+            self.writer = csv.writer(self.csvfile)
+            self.writer.writerow(["URL", "Content-Type", "Organization"])
+
+    def __call__(self, url, media_type, org):
+        if url in self.seen:
+            return
+        self.seen.add(url)
+        self.writer.writerow([url, media_type, org])
+        self.csvfile.flush()
+
+    def close(self):
+        self.csvfile.close()
+
+def iter_index_rows():
+    with open(csv_path, newline='', encoding='utf-8') as csvfile:
+        yield from csv.DictReader(csvfile)
+
+# Streams (url, title, organization, text) back from disk one page at a time
+def iter_pages():
+    for row in iter_index_rows():
+        with open(os.path.join(txt_dir, row['Filename']), encoding='utf-8') as f:
+            text = f.read()
+        yield row['URL'], row['Title'], row['Organization'], text
+
+def iter_document_rows():
+    with open(documents_path, newline='', encoding='utf-8') as csvfile:
+        yield from csv.DictReader(csvfile)
+
+# --- PDF Documents ---
+# The research PDFs next to this script and the PDFs the crawl listed in
+# documents.csv go into the same index.csv/pages store as web pages, so the
+# NLP stage treats them alike. Crawled PDFs are streamed to docs_dir; every
+# file is hashed in blocks, and extraction (page by page, PDF_PAGES_PER_TASK
+# pages per process-pool task) is cached by that hash in DocumentCache.
+# Crawled PDFs are kept only if their text hits a keyword; local ones are
+# always kept. Nothing reads a whole PDF into memory: PdfReader is given an
+# open file, since given a path pypdf reads the entire file up front.
+def file_hash(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(2**20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+def open_pdf(f):
+    from pypdf import PdfReader
+    reader = PdfReader(f)
+    if reader.is_encrypted:
+        reader.decrypt('')
+    return reader
+
+# Runs in the extraction processes. Returns (page count, title), or
+# (None, error message) for files pypdf can't open
+def pdf_info(path):
+    try:
+        with open(path, 'rb') as f:
+            reader = open_pdf(f)
+            title = reader.metadata.title if reader.metadata else None
+            title = ' '.join(unescape(str(title or '')).split())
+            return len(reader.pages), '' if title.lower() == 'untitled' else title
+    except Exception as e:
+        return None, str(e)
+
+# Runs in the extraction processes. Returns the text of pages [start, end);
+# a page that fails to extract comes back empty
+def extract_pdf_pages(path, start, end):
+    texts = []
+    try:
+        with open(path, 'rb') as f:
+            reader = open_pdf(f)
+            for i in range(start, end):
+                try:
+                    text = reader.pages[i].extract_text() or ''
+                except Exception:
+                    text = ''
+                texts.append('\n'.join(line.strip() for line in text.splitlines() if line.strip()))
+    except Exception as e:
+        logging.error(f"Failed to extract pages {start}-{end} of {path}: {e}")
+    return texts + [''] * (end - start - len(texts))
+
+class DocumentCache(SQLiteStore):
+    def __init__(self, path=None):
+        super().__init__(path or doc_cache_path, row_factory=sqlite3.Row)
+        self.db.execute("""
+            CREATE TABLE IF NOT EXISTS documents (
+                hash TEXT PRIMARY KEY, title TEXT, page_count INTEGER, chars INTEGER,
+                hit INTEGER, extracted_at REAL)
+        """)
+        self.db.execute("""
+            CREATE TABLE IF NOT EXISTS document_pages (
+                hash TEXT, page INTEGER, text TEXT, PRIMARY KEY (hash, page)) WITHOUT ROWID
+        """)
+
+    # Only documents whose extraction finished are in `documents`
+    def get(self, digest):
+        return self.db.execute("SELECT * FROM documents WHERE hash = ?", (digest,)).fetchone()
+
+    def pages(self, digest):
+        for (text,) in self.db.execute("SELECT text FROM document_pages WHERE hash = ? ORDER BY page",
+                                       (digest,)):
+            yield text
+
+    def put_page(self, digest, page, text):
+        self.db.execute("INSERT OR REPLACE INTO document_pages (hash, page, text) VALUES (?, ?, ?)",
+                        (digest, page, text))
+
+    def finish(self, digest, title, page_count, chars, hit):
+        self.db.execute(
+            """INSERT OR REPLACE INTO documents (hash, title, page_count, chars, hit, extracted_at)
+               VALUES (?, ?, ?, ?, ?, ?)""",
+            (digest, title, page_count, chars, int(hit), time.time()))
+        self.db.commit()
+
+# Yields (url, org, path, require_hit) for the PDFs in pdf_dir
+def local_documents(pdf_dir):
+    for name in sorted(os.listdir(pdf_dir)):
+        path = os.path.join(pdf_dir, name)
+        if name.lower().endswith('.pdf') and os.path.isfile(path):
+            yield Path(path).resolve().as_uri(), LOCAL_DOCUMENT_ORG, path, False
+
+async def download_document(client, url, path):
+    part = f"{path}.part"
     try:
-        summary = summarizer(text[:1000], max_length=130, min_length=30, do_sample=False)[0]['summary_text']
-    except Exception:
-        summary = ""
+        async with client.stream("GET", url) as resp:
+            resp.raise_for_status()
+            length = resp.headers.get('Content-Length', '')
+            if length.isdigit() and int(length) > MAX_DOCUMENT_BYTES:
+                raise ValueError(f"{length} bytes is over MAX_DOCUMENT_BYTES")
+            size = 0
+            with open(part, 'wb') as f:
+                async for chunk in resp.aiter_bytes():
+                    size += len(chunk)
+                    if size > MAX_DOCUMENT_BYTES:
+                        raise ValueError("larger than MAX_DOCUMENT_BYTES")
+                    f.write(chunk)
+        os.replace(part, path)
+    finally:
+        if os.path.exists(part):
+            os.remove(part)
+
+# Downloads the documents.csv PDFs not already in docs_dir; hosts in
+# parallel, one file at a time per host. Returns (url, org, path,
+# require_hit) for every PDF that is on disk afterwards.
+async def download_documents_async(rows):
+    os.makedirs(docs_dir, exist_ok=True)
+    by_host = {}
+    for row in rows:
+        by_host.setdefault(get_domain(row['URL']), []).append((row['URL'], row['Organization']))
 
-    doc = nlp(text)
-    entities = [(ent.text, ent.label_) for ent in doc.ents]
+    async def fetch_host(client, items):
+        done = []
+        fetched = 0
+        for url, org in items:
+            path = os.path.join(docs_dir, hashlib.sha1(url.encode('utf-8')).hexdigest() + ".pdf")
+            if not os.path.exists(path):
+                if fetched:
+                    await asyncio.sleep(1.0 / PER_HOST_RATE)
+                fetched += 1
+                try:
+                    await download_document(client, url, path)
+                except Exception as e:
+                    logging.error(f"Failed to download {url}: {e}")
+                    continue
+            done.append((url, org, path, True))
+        return done
 
+    async with make_client() as client:
+        results = await asyncio.gather(*(fetch_host(client, items) for items in by_host.values()))
+    return [doc for done in results for doc in done]
+
+def download_documents(rows):
+    return asyncio.run(download_documents_async(rows))
+
+# Extracts (or reads from the cache) each document and streams its pages to
+# writer.write_parts(). Returns the number of documents kept.
+def ingest_documents(docs, writer, cache, workers=PDF_WORKERS):
+    hashed = [(url, org, path, require_hit, file_hash(path)) for url, org, path, require_hit in docs]
+    # Files already in the index count too, so a copy under another name
+    # stays out on later runs
+    digests = {doc[4] for doc in hashed if doc[0] in writer.seen}
+    todo = []
+    for url, org, path, require_hit, digest in hashed:
+        if url in writer.seen:
+            continue
+        if digest in digests:
+            logging.info(f"Skipping {path}: same file as another document")
+            continue
+        digests.add(digest)
+        todo.append((url, org, path, require_hit, digest))
+
+    misses = [doc for doc in todo if cache.get(doc[4]) is None]
+    pool = ProcessPoolExecutor(workers) if workers and misses else None
+    run = pool.map if pool is not None else map
     try:
-        sentiment = sentiment_analyzer(text[:512])
-    except Exception:
-        sentiment = []
+        infos = dict(zip((doc[4] for doc in misses), run(pdf_info, [doc[2] for doc in misses])))
+        tasks = [(doc[2], start, min(start + PDF_PAGES_PER_TASK, infos[doc[4]][0]))
+                 for doc in misses if infos[doc[4]][0]
+                 for start in range(0, infos[doc[4]][0], PDF_PAGES_PER_TASK)]
+        # Results come back in task order, which is document and page order
+        results = run(extract_pdf_pages, *zip(*tasks)) if tasks else iter(())
+
+        def extracted(digest, title, page_count):
+            chars = 0
+            hit = False
+            for start in range(0, page_count, PDF_PAGES_PER_TASK):
+                for page, text in enumerate(next(results), start):
+                    cache.put_page(digest, page, text)
+                    chars += len(text)
+                    hit = hit or bool(keyword_matcher.count(text))
+                    yield text
+            cache.finish(digest, title, page_count, chars, hit)
+
+        kept = 0
+        for url, org, path, require_hit, digest in todo:
+            name = os.path.splitext(os.path.basename(path))[0]
+            row = cache.get(digest)
+            if row is not None:
+                title, parts = row['title'], cache.pages(digest)
+            else:
+                page_count, title = infos[digest]
+                if page_count is None:
+                    logging.warning(f"Skipping {path}: {title}")
+                    continue
+                parts = extracted(digest, title, page_count)
 
-    analysis_results.append({
-        "url": url, "title": title, "organization": org,
-        "summary": summary, "entities": entities, "sentiment": sentiment
-    })
+            def keep():
+                row = cache.get(digest)
+                if not row['chars']:
+                    logging.warning(f"No extractable text in {path} (scanned?)")
+                return bool(row['chars']) and (bool(row['hit']) or not require_hit)
+
+            if writer.write_parts(url, title or name, org, parts, keep):
+                kept += 1
+                logging.info(f"Ingested: {url}")
+    finally:
+        if pool is not None:
+            pool.shutdown()
+    return kept
+
+# --- Load NLP Models ---
+# Loaded on first use and kept for the rest of the run, so recrawls where
+# every page hits the analysis cache never load a model at all
+@lru_cache(maxsize=None)
+def get_nlp():
+    import spacy
+    return spacy.load(SPACY_MODEL, exclude=SPACY_EXCLUDE)
+
+@lru_cache(maxsize=None)
+def get_summarizer():
+    from transformers import pipeline
+    return pipeline("summarization", model=SUMMARY_MODEL, revision=SUMMARY_REVISION)
+
+@lru_cache(maxsize=None)
+def get_sentiment_analyzer():
+    from transformers import pipeline
+    return pipeline("sentiment-analysis", model=SENTIMENT_MODEL, revision=SENTIMENT_REVISION)
+
+# --- NLP Result Cache ---
+# Content-addressed: a result is keyed by the hash of the page text plus the
+# model, its revision and the truncation/generation settings that produced
+# it, so any of those changing is a cache miss rather than a stale hit. The
+# installed spaCy model's package version stands in for its revision, read
+# without importing spaCy.
+def spacy_model_version():
+    try:
+        return importlib.metadata.version(SPACY_MODEL)
+    except importlib.metadata.PackageNotFoundError:
+        return "unknown"
+
+def nlp_task_specs():
+    return {
+        "summary": [SUMMARY_MODEL, SUMMARY_REVISION, SUMMARY_INPUT_CHARS, SUMMARY_ARGS]
+                   + ([SUMMARY_MODE, SUMMARY_CHUNK_TOKENS, SUMMARY_MAX_CHUNKS, SUMMARY_CHUNK_ARGS]
+                      if SUMMARY_MODE == "chunked" else []),
+        "entities": [SPACY_MODEL, spacy_model_version(), SPACY_INPUT_CHARS, None],
+        "sentiment": [SENTIMENT_MODEL, SENTIMENT_REVISION, SENTIMENT_INPUT_CHARS, None],
+    }
+
+class NLPCache(SQLiteStore):
+    def __init__(self, path=None, max_mb=NLP_CACHE_MAX_MB):
+        super().__init__(path or nlp_cache_path)
+        self.max_bytes = max_mb * 1024 * 1024
+        self.specs = nlp_task_specs()
+        self.db.execute("""
+            CREATE TABLE IF NOT EXISTS results (
+                key TEXT PRIMARY KEY, value TEXT NOT NULL, size INTEGER NOT NULL,
+                last_used REAL NOT NULL)
+        """)
+        self.db.execute("CREATE INDEX IF NOT EXISTS results_last_used ON results (last_used)")
+        self.total = self.db.execute("SELECT COALESCE(SUM(size), 0) FROM results").fetchone()[0]
+
+    def key(self, task, text):
+        spec = json.dumps([text_hash(text), task] + self.specs[task], sort_keys=True)
+        return hashlib.sha256(spec.encode('utf-8')).hexdigest()
+
+    def get(self, task, text):
+        key = self.key(task, text)
+        row = self.db.execute("SELECT value FROM results WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        self.db.execute("UPDATE results SET last_used = ? WHERE key = ?", (time.time(), key))
+        return json.loads(row[0])
+
+    def put(self, task, text, value):
+        key = self.key(task, text)
+        blob = json.dumps(value)
+        old = self.db.execute("SELECT size FROM results WHERE key = ?", (key,)).fetchone()
+        self.db.execute("INSERT OR REPLACE INTO results (key, value, size, last_used) VALUES (?, ?, ?, ?)",
+                        (key, blob, len(blob), time.time()))
+        self.total += len(blob) - (old[0] if old else 0)
+        if self.total > self.max_bytes:
+            self.evict()
+
+    def evict(self):
+        # Drop least recently used entries until 90% of the budget is free
+        target = self.max_bytes * 0.9
+        rows = self.db.execute("SELECT key, size FROM results ORDER BY last_used").fetchall()
+        for key, size in rows:
+            if self.total <= target:
+                break
+            self.db.execute("DELETE FROM results WHERE key = ?", (key,))
+            self.total -= size
+
+# --- NLP Analysis ---
+def chunked(iterable, size):
+    it = iter(iterable)
+    while chunk := list(itertools.islice(it, size)):
+        yield chunk
+
+# Runs a transformers pipeline over `inputs` in length-sorted batches so each
+# batch pads to similar lengths. Returns one output per input, in input order;
+# if a batch raises, its inputs are retried one by one and any that still
+# fail come back as None.
+def run_batched(pipe, inputs, batch_size, **kwargs):
+    outputs = [None] * len(inputs)
+    order = sorted(range(len(inputs)), key=lambda i: len(inputs[i]))
+    for idx in chunked(order, batch_size):
+        batch = [inputs[i] for i in idx]
+        try:
+            batch_out = pipe(batch, batch_size=len(batch), **kwargs)
+        except Exception as e:
+            logging.warning(f"Batch of {len(batch)} failed ({e}); retrying pages one by one")
+            batch_out = []
+            for item in batch:
+                try:
+                    batch_out.append(pipe(item, **kwargs)[0])
+                except Exception:
+                    batch_out.append(None)
+        for i, out in zip(idx, batch_out):
+            outputs[i] = out
+    return outputs
+
+# --- Long-Document Summarization ---
+# Splits text into line-aligned chunks of at most `budget` tokens, stopping
+# after `max_chunks`. A single line longer than the budget becomes its own
+# chunk and is truncated by the pipeline.
+def split_into_chunks(text, tokenizer, budget=SUMMARY_CHUNK_TOKENS, max_chunks=SUMMARY_MAX_CHUNKS):
+    # No need to tokenize text past what the chunk cap could ever use
+    lines = [line for line in text[:budget * max_chunks * 8].split('\n') if line.strip()]
+    if not lines:
+        return []
+    lengths = [len(ids) for ids in tokenizer(lines, add_special_tokens=False)['input_ids']]
+    chunks, current, used = [], [], 0
+    for line, n in zip(lines, lengths):
+        if current and used + n > budget:
+            chunks.append(' '.join(current))
+            current, used = [], 0
+            if len(chunks) == max_chunks:
+                return chunks
+        current.append(line)
+        used += n
+    chunks.append(' '.join(current))
+    return chunks
+
+# Map-reduce summaries for a batch of pages. Map: every chunk of every
+# multi-chunk page is summarized in one batched pass, so chunks from
+# different pages share batches. Reduce: each page's chunk summaries (or its
+# only chunk) are summarized again, also batched across pages. Returns one
+# summary per text, None where it failed.
+def summarize_chunked(texts):
+    summarizer = get_summarizer()
+    page_chunks = [split_into_chunks(text, summarizer.tokenizer) for text in texts]
+
+    mapped = [(p, chunk) for p, chunks in enumerate(page_chunks) if len(chunks) > 1 for chunk in chunks]
+    partial = [[] for _ in texts]
+    outputs = run_batched(summarizer, [chunk for _, chunk in mapped], SUMMARY_BATCH_SIZE,
+                          truncation=True, **SUMMARY_CHUNK_ARGS)
+    for (p, _), out in zip(mapped, outputs):
+        if out:
+            partial[p].append(out['summary_text'])
+
+    reduce_idx, reduce_inputs = [], []
+    for p, chunks in enumerate(page_chunks):
+        source = chunks if len(chunks) == 1 else partial[p]
+        if source:
+            reduce_idx.append(p)
+            reduce_inputs.append(' '.join(source))
+    summaries = [None] * len(texts)
+    outputs = run_batched(summarizer, reduce_inputs, SUMMARY_BATCH_SIZE, truncation=True, **SUMMARY_ARGS)
+    for p, out in zip(reduce_idx, outputs):
+        summaries[p] = out['summary_text'] if out else None
+    return summaries
+
+def summarize_texts(texts):
+    if SUMMARY_MODE == "chunked":
+        return summarize_chunked(texts)
+    outputs = run_batched(get_summarizer(), [text[:SUMMARY_INPUT_CHARS] for text in texts],
+                          SUMMARY_BATCH_SIZE, **SUMMARY_ARGS)
+    return [out['summary_text'] if out else None for out in outputs]
+
+NLP_TASKS = ("summary", "entities", "sentiment")
+
+# One streaming nlp.pipe pass over every page, so the worker processes are
+# started once per run. Items are (page, results, missing) where `missing`
+# holds the tasks with no cached result; pages whose entities are cached are
+# sent as empty text, the rest cut to SPACY_INPUT_CHARS. spaCy is only
+# loaded once a page needs it.
+def extract_entities(items):
+    items = iter(items)
+    for item in items:
+        if "entities" in item[2]:
+            items = itertools.chain([item], items)
+            break
+        yield item
+    else:
+        return
+
+    stream = (("" if "entities" not in missing else page[3][:SPACY_INPUT_CHARS],
+               (page, results, missing))
+              for page, results, missing in items)
+    for doc, (page, results, missing) in get_nlp().pipe(stream, as_tuples=True,
+                                                        batch_size=SPACY_BATCH_SIZE,
+                                                        n_process=SPACY_PROCESSES):
+        if "entities" in missing:
+            results["entities"] = [(ent.text, ent.label_) for ent in doc.ents]
+        yield page, results, missing
+
+# Generator over `pages`: entities come from the streaming nlp.pipe stage,
+# then NLP_CHUNK_PAGES at a time go through the summarizer and sentiment
+# model in batches, and one analysis per page is yielded in the original
+# order. Each task's result is looked up in / stored to the NLPCache on its
+# own; failed summaries or sentiment are not cached so the next run retries.
+def analyze_pages(pages, nlp_cache=None, chunk_pages=NLP_CHUNK_PAGES):
+    def with_cache():
+        for page in pages:
+            results = {task: nlp_cache.get(task, page[3]) if nlp_cache is not None else None
+                       for task in NLP_TASKS}
+            yield page, results, {task for task, value in results.items() if value is None}
+
+    start = time.perf_counter()
+    done = 0
+    for items in chunked(extract_entities(with_cache()), chunk_pages):
+        sum_todo = [i for i, (_, _, missing) in enumerate(items) if "summary" in missing]
+        sent_todo = [i for i, (_, _, missing) in enumerate(items) if "sentiment" in missing]
+
+        if sum_todo:
+            summaries = summarize_texts([items[i][0][3] for i in sum_todo])
+            for i, summary in zip(sum_todo, summaries):
+                items[i][1]["summary"] = summary
+        if sent_todo:
+            sentiments = run_batched(get_sentiment_analyzer(),
+                                     [items[i][0][3][:SENTIMENT_INPUT_CHARS] for i in sent_todo],
+                                     SENTIMENT_BATCH_SIZE)
+            for i, sentiment in zip(sent_todo, sentiments):
+                items[i][1]["sentiment"] = [sentiment] if sentiment else None
+
+        for (url, title, org, text), results, missing in items:
+            if nlp_cache is not None:
+                for task in missing:
+                    if results[task] is not None:
+                        nlp_cache.put(task, text, results[task])
+            yield {
+                "url": url, "title": title, "organization": org,
+                "summary": results["summary"] or "",
+                "entities": results["entities"] or [],
+                "sentiment": results["sentiment"] or [],
+            }
+        if nlp_cache is not None:
+            nlp_cache.commit()
+
+        done += len(items)
+        elapsed = time.perf_counter() - start
+        logging.info(f"NLP: {done} pages analyzed ({len(sum_todo)} summarized in this chunk), "
+                     f"{done / elapsed:.2f} pages/s")
 
 # --- Word Report Generation ---
-doc = Document()
-doc.add_heading("Autism Employment Programs: Evidence and Outcomes", level=1)
-doc.add_paragraph("This report summarizes web-sourced programs designed to improve employment outcomes for autistic individuals.")
-
-for i, item in enumerate(analysis_results, 1):
-    doc.add_heading(f"{i}. {item['organization']}", level=2)
-    doc.add_paragraph(item['title'], style='List Bullet')
-    doc.add_paragraph(f"Source: {item['url']}")
-    doc.add_heading("Summary", level=3)
-    doc.add_paragraph(item['summary'] or "No summary generated.")
-    doc.add_heading("Named Entities", level=3)
-    ents = ", ".join([f"{txt} ({lbl})" for txt, lbl in item['entities']]) or "None"
-    doc.add_paragraph(ents)
-    doc.add_heading("Sentiment", level=3)
-    sentiments = "; ".join([f"{s['label']} ({s['score']:.2f})" for s in item['sentiment']]) or "Not analyzed"
-    doc.add_paragraph(sentiments)
-
-doc.add_heading("References", level=1)
-for i, item in enumerate(analysis_results, 1):
-    doc.add_paragraph(f"[{i}] {item['title']}. Available at: {item['url']}")
-
-doc.save(report_path)
-logging.info(f"✔ Word report saved to {report_path}")
+# Consumes the analysis stream item by item; only titles and URLs are kept
+# back for the references section.
+def write_report(analysis_results):
+    from docx import Document
+
+    references = []
+    doc = Document()
+    doc.add_heading("Autism Employment Programs: Evidence and Outcomes", level=1)
+    doc.add_paragraph("This report summarizes web-sourced programs designed to improve employment outcomes for autistic individuals.")
+
+    for i, item in enumerate(analysis_results, 1):
+        doc.add_heading(f"{i}. {item['organization']}", level=2)
+        doc.add_paragraph(item['title'], style='List Bullet')
+        doc.add_paragraph(f"Source: {item['url']}")
+        doc.add_heading("Summary", level=3)
+        doc.add_paragraph(item['summary'] or "No summary generated.")
+        doc.add_heading("Named Entities", level=3)
+        ents = ", ".join([f"{txt} ({lbl})" for txt, lbl in item['entities']]) or "None"
+        doc.add_paragraph(ents)
+        doc.add_heading("Sentiment", level=3)
+        sentiments = "; ".join([f"{s['label']} ({s['score']:.2f})" for s in item['sentiment']]) or "Not analyzed"
+        doc.add_paragraph(sentiments)
+        references.append((item['title'], item['url']))
+
+    doc.add_heading("References", level=1)
+    for i, (title, url) in enumerate(references, 1):
+        doc.add_paragraph(f"[{i}] {title}. Available at: {url}")
+
+    doc.save(report_path)
+    logging.info(f"✔ Word report saved to {report_path}")
+
+# --- Run Pipeline ---
+# Guarded so helper scripts (e.g. bench_parse.py) and the parser processes
+# can import this module without starting a crawl.
+#   --phase crawl  fetch pages and write pages/ + index.csv only
+#   --phase docs   add the local and crawled PDFs to pages/ + index.csv
+#   --phase nlp    analyze an existing index.csv and write the report
+#   --phase all    all three (default; what the scheduled job runs)
+def run_crawl(args):
+    store = FrontierStore()
+    page_cache = PageCache()
+    writer = PageWriter(resume=not store.is_empty())
+    documents = DocumentLog(resume=not store.is_empty())
+    try:
+        kept = crawl(seed_urls, writer, max_pages=args.max_pages, max_depth=args.max_depth,
+                     concurrency=args.concurrency, store=store, page_cache=page_cache,
+                     visited_backend=args.visited_backend, respect_robots=not args.ignore_robots,
+                     use_sitemaps=not args.no_sitemaps, on_document=documents)
+        writer.close()
+        # The crawl is complete, so the next scheduled run starts fresh
+        store.clear()
+        logging.info(f"Crawl finished: {kept} pages kept, index at {csv_path}, "
+                     f"{len(documents.seen)} documents listed in {documents_path}")
+    finally:
+        writer.close()
+        documents.close()
+        store.close()
+        page_cache.close()
+
+def run_documents(args):
+    cache = DocumentCache()
+    writer = PageWriter(resume=True)
+    try:
+        docs = list(local_documents(args.pdf_dir)) if args.pdf_dir else []
+        if os.path.exists(documents_path):
+            docs += download_documents(iter_document_rows())
+        kept = ingest_documents(docs, writer, cache, workers=args.pdf_workers)
+        logging.info(f"Documents finished: {kept} of {len(docs)} PDFs added to {csv_path}")
+    finally:
+        writer.close()
+        cache.close()
+
+def run_nlp(args):
+    nlp_cache = NLPCache()
+    try:
+        write_report(analyze_pages(iter_pages(), nlp_cache=nlp_cache))
+    finally:
+        nlp_cache.close()
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Autism employment program crawler & NLP analyzer")
+    parser.add_argument("--phase", choices=["crawl", "docs", "nlp", "all"], default="all")
+    parser.add_argument("--output-dir", default=output_dir)
+    parser.add_argument("--max-pages", type=int, default=200)
+    parser.add_argument("--max-depth", type=int, default=3)
+    parser.add_argument("--concurrency", type=int, default=CONCURRENCY)
+    parser.add_argument("--visited-backend", choices=["memory", "bloom", "disk"], default=VISITED_BACKEND)
+    parser.add_argument("--ignore-robots", action="store_true", default=not RESPECT_ROBOTS,
+                        help="don't consult robots.txt (only for sites you have permission to crawl)")
+    parser.add_argument("--no-sitemaps", action="store_true", default=not USE_SITEMAPS,
+                        help="crawl from the seed URLs only, without sitemap seeding")
+    parser.add_argument("--pdf-dir", default=LOCAL_PDF_DIR,
+                        help="folder of local PDFs to ingest; empty string for none")
+    parser.add_argument("--pdf-workers", type=int, default=PDF_WORKERS)
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv)
+    set_output_dir(args.output_dir)
+    if args.phase in ("crawl", "all"):
+        run_crawl(args)
+    if args.phase in ("docs", "all"):
+        run_documents(args)
+    if args.phase in ("nlp", "all"):
+        run_nlp(args)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+
+# ============================================================================
+# FRONTIER BENCHMARK: HostScheduler speed and internal heap sizes under churn
+# ============================================================================
+# Usage:
+#   python bench_frontier.py              (50,000 puts per scenario)
+#   python bench_frontier.py 500000
+# Each scenario mixes put() with get() at random scores across a few hosts,
+# the way a crawl does, then checks that every internal heap stays
+# proportional to the frontier size (max_size) or the number of hosts rather
+# than to the number of URLs ever queued. Exits non-zero if one does not.
+
+import sys
+import time
+import random
+import asyncio
+
+import autism_employment_full_crawler as crawler
+
+MAX_SIZE = 100
+HOSTS = 20
+SCENARIOS = [
+    # (overflow, max_size, rising scores, get after every other put)
+    ("drop-lowest", MAX_SIZE, True, False),
+    ("drop-lowest", MAX_SIZE, False, True),
+    ("drop-new", MAX_SIZE, False, True),
+    ("drop-lowest", 0, False, True),
+]
+
+def heap_sizes(scheduler):
+    return {
+        "live": len(scheduler.live),
+        "lowest": len(scheduler.lowest),
+        "host heaps": sum(len(q) for q in scheduler.queues.values()),
+        "available": len(scheduler.available),
+        "waiting": len(scheduler.waiting),
+    }
+
+async def run_scenario(overflow, max_size, rising, with_gets, n):
+    rng = random.Random(0)
+    scheduler = crawler.HostScheduler(rate=1e9, max_size=max_size, overflow=overflow)
+    handed_out = 0
+    largest = {}
+    start = time.perf_counter()
+    for i in range(n):
+        score = float(i) if rising else rng.random() * 100
+        scheduler.put(f"https://state{i % HOSTS}.gov/programs/page-{i}", 1, score)
+        if with_gets and i % 2:
+            item = await scheduler.get()
+            if item is not None:
+                handed_out += 1
+                scheduler.task_done()
+        for name, size in heap_sizes(scheduler).items():
+            largest[name] = max(largest.get(name, 0), size)
+    elapsed = time.perf_counter() - start
+
+    # Bounds: URL heaps within a small multiple of what is actually queued,
+    # host heaps within a small multiple of the number of hosts
+    queued_bound = 2 * (max_size or n) + 16 + HOSTS
+    host_bound = 2 * HOSTS + 16
+    bounds = {"live": max_size or n, "lowest": queued_bound, "host heaps": queued_bound,
+              "available": host_bound, "waiting": host_bound}
+    failed = [name for name, size in largest.items() if size > bounds[name]]
+
+    label = f"{overflow}, max_size={max_size or 'unbounded'}, {'rising' if rising else 'random'}"
+    label += " scores, with gets" if with_gets else " scores"
+    print(f"{label}: {n / elapsed:,.0f} puts/s, {handed_out:,} handed out")
+    for name, size in largest.items():
+        print(f"    {name:<11} peak {size:>7,}  (bound {bounds[name]:,})")
+    return failed
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000
+    failures = []
+    for scenario in SCENARIOS:
+        for name in asyncio.run(run_scenario(*scenario, n)):
+            failures.append(f"{scenario[0]}/{scenario[1]}: {name}")
+    if failures:
+        sys.exit("Heaps grew past their bound: " + ", ".join(failures))
+    print("All heaps stayed within bounds")
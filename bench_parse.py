@@ -0,0 +1,126 @@
+
+# ============================================================================
+# PARSE BENCHMARK: single lxml parse vs. the old BeautifulSoup double parse
+# ============================================================================
+# Usage:
+#   python bench_parse.py saved_page.html other_page.html ...
+#   python bench_parse.py https://www.dol.gov/agencies/odep ...
+#   python bench_parse.py            (fetches the crawler's seed URLs)
+# The wrapper layouts below are checked first; the run stops if any of them
+# loses its content.
+
+import sys
+import time
+from urllib.parse import urljoin, urlsplit
+
+import httpx
+from bs4 import BeautifulSoup
+
+from autism_employment_full_crawler import (parse_page, process_page, canonicalize_url, seed_urls,
+                                            SKIP_LINK_EXT_RE, USER_AGENT)
+
+REPEAT = 20
+
+# --- Old Path: one parse for title/text, a second one in extract_links ---
+def double_parse(html, base_url):
+    soup = BeautifulSoup(html, 'html.parser')
+    title = soup.title.string.strip() if soup.title and soup.title.string else ''
+    text = soup.get_text(separator='\n', strip=True)
+    soup = BeautifulSoup(html, 'html.parser')
+    links = set()
+    for tag in soup.find_all('a', href=True):
+        abs_url = urljoin(base_url, tag.get('href'))
+        if abs_url.startswith("http"):
+            links.add(abs_url)
+    return title, text, links
+
+# The old links in the form parse_page() returns them, so the comparison
+# only flags real differences
+def comparable_links(links):
+    canonical = set()
+    for url in links:
+        try:
+            url = canonicalize_url(url)
+        except ValueError:
+            continue
+        if not SKIP_LINK_EXT_RE.search(urlsplit(url).path):
+            canonical.add(url)
+    return canonical
+
+# --- Wrapper Layouts ---
+# Whole-page wrappers that boilerplate stripping must keep, with the content
+# inside them: (html, text that must survive, text that must be stripped)
+ARTICLE = "<p>" + "Supported employment programs for autistic adults improve job outcomes. " * 8 + "</p>"
+SEARCH_FORM = '<form action="/search"><input name="q"> Search this site</form>'
+WRAPPER_CASES = {
+    "WordPress has-sidebar": (
+        f'<html><body><div id="page" class="site has-sidebar"><main>{ARTICLE}</main></div></body></html>',
+        "Supported employment", None),
+    "social-share wrapper": (
+        f'<html><body><div class="social-share-enabled"><article>{ARTICLE}</article></div></body></html>',
+        "Supported employment", None),
+    "ASP.NET form": (
+        f'<html><body><form id="aspnetForm" method="post">{SEARCH_FORM}'
+        f'<div id="contentBox">{ARTICLE}</div></form></body></html>',
+        "Supported employment", "Search this site"),
+    "SharePoint form and header": (
+        f'<html><body><form id="aspnetForm"><header><div class="ms-rte">{ARTICLE}</div></header>'
+        f'</form></body></html>',
+        "Supported employment", None),
+}
+
+def check_wrappers():
+    failed = []
+    for name, (html, keep, strip) in WRAPPER_CASES.items():
+        _, text, _, hit = process_page(html, "https://example.org/")
+        if keep not in text or not hit or (strip and strip in text):
+            failed.append(name)
+    return failed
+
+# --- Load Sample Pages ---
+def load_pages(sources):
+    pages = []
+    with httpx.Client(follow_redirects=True, timeout=10, headers={"User-Agent": USER_AGENT}) as client:
+        for src in sources:
+            if src.startswith("http"):
+                try:
+                    resp = client.get(src)
+                    resp.raise_for_status()
+                    pages.append((src, resp.text))
+                except Exception as e:
+                    print(f"skip {src}: {e}")
+            else:
+                with open(src, encoding='utf-8', errors='replace') as f:
+                    pages.append(("https://example.org/" + src, f.read()))
+    return pages
+
+def bench(fn, pages):
+    start = time.perf_counter()
+    for _ in range(REPEAT):
+        for url, html in pages:
+            fn(html, url)
+    return (time.perf_counter() - start) / (REPEAT * len(pages))
+
+if __name__ == "__main__":
+    failed = check_wrappers()
+    if failed:
+        sys.exit(f"Content lost for wrapper layouts: {', '.join(failed)}")
+    print(f"{len(WRAPPER_CASES)} wrapper layouts keep their content")
+
+    pages = load_pages(sys.argv[1:] or seed_urls)
+    if not pages:
+        sys.exit("No pages to benchmark")
+    size_kb = sum(len(html) for _, html in pages) / len(pages) / 1024
+    print(f"{len(pages)} pages, {size_kb:.0f} KB average, {REPEAT} rounds")
+
+    old = bench(double_parse, pages)
+    new = bench(parse_page, pages)
+    print(f"BeautifulSoup x2 : {old * 1000:8.2f} ms/page")
+    print(f"lxml single parse: {new * 1000:8.2f} ms/page  ({old / new:.1f}x faster)")
+
+    for url, html in pages:
+        old_links = comparable_links(double_parse(html, url)[2])
+        _, _, new_links = parse_page(html, url)
+        new_links = set(new_links)
+        if old_links != new_links:
+            print(f"note: link sets differ for {url} ({len(old_links)} vs {len(new_links)})")
@@ -0,0 +1,72 @@
+
+# ============================================================================
+# VISITED-SET BENCHMARK: memory and speed of the three visited backends
+# ============================================================================
+# Usage:
+#   python bench_visited.py              (100,000 URLs per backend)
+#   python bench_visited.py 1000000
+# Each backend runs in a fresh process so peak memory is measured in
+# isolation: tracemalloc for Python-level allocations, plus peak RSS growth
+# on platforms with the `resource` module (SQLite's page cache only shows
+# up there).
+
+import os
+import sys
+import time
+import tempfile
+import subprocess
+import tracemalloc
+
+import autism_employment_full_crawler as crawler
+
+BACKENDS = ["memory", "bloom", "disk"]
+
+def synthetic_keys(n, offset=0):
+    for i in range(offset, offset + n):
+        yield f"//state{i % 50}.gov/programs/vocational-rehabilitation/page-{i}?id={i * 7919}"
+
+def peak_rss_kb():
+    try:
+        import resource
+    except ImportError:
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss // 1024 if sys.platform == "darwin" else rss
+
+def run_backend(backend, n):
+    tmp_dir = tempfile.TemporaryDirectory(prefix="bench_visited_")
+    crawler.set_output_dir(tmp_dir.name)
+    rss_before = peak_rss_kb()
+    tracemalloc.start()
+    url_set = crawler.make_url_set("visited", backend)
+
+    start = time.perf_counter()
+    for key in synthetic_keys(n):
+        url_set.add(key)
+    add_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    hits = sum(1 for key in synthetic_keys(n) if key in url_set)
+    false_hits = sum(1 for key in synthetic_keys(n, offset=n) if key in url_set)
+    lookup_time = time.perf_counter() - start
+
+    _, traced_peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    rss_after = peak_rss_kb()
+    rss = f"{(rss_after - rss_before) / 1024:8.1f}" if rss_before is not None else "     n/a"
+    if backend != "memory":
+        url_set.close()
+    tmp_dir.cleanup()
+    print(f"{backend:<7} {traced_peak / 2**20:9.1f} {rss} {n / add_time:11,.0f} "
+          f"{2 * n / lookup_time:11,.0f} {hits / n:7.2%} {false_hits / n:8.4%}")
+
+if __name__ == "__main__":
+    if len(sys.argv) > 2 and sys.argv[1] == "--child":
+        run_backend(sys.argv[2], int(sys.argv[3]))
+        sys.exit()
+
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    print(f"{n:,} URLs per backend, Bloom error rate {crawler.BLOOM_ERROR_RATE}")
+    print("backend  traced MB   RSS MB      adds/s   lookups/s  recall   false+")
+    for backend in BACKENDS:
+        subprocess.run([sys.executable, os.path.abspath(__file__), "--child", backend, str(n)], check=True)